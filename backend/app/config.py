@@ -45,6 +45,9 @@ class Settings(BaseSettings):
     # auto: Gemini優先、なければClaude
     ai_provider: str = "auto"
     
+    # AI生成APIの同時リクエスト数上限（多言語の並列生成時のレート制限対策）
+    ai_max_concurrency: int = 8
+
     # レート制限設定
     rate_limit_general: str = "60/minute"
     rate_limit_translate: str = "20/minute"
@@ -5,9 +5,9 @@ SQLAlchemy (async) によるDB接続。
 開発: SQLite (aiosqlite)
 本番: PostgreSQL (asyncpg) に切替可能。
 """
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.exc import OperationalError, ProgrammingError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from .config import settings
@@ -20,10 +20,31 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.environment == "development",
-)
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    """SQLite を WAL モードにする（接続ごとに呼ばれる）
+
+    既定のロールバックジャーナルでは書き込みのコミット中に読み取りが待たされ、
+    読み取り中は書き込みがコミットできない。WAL では読み取り（通知の一斉送信で
+    全サブスクリプションを読む等）と登録・解除の書き込みが互いを待たない。
+    インメモリDBでは "memory" のまま変わらない。
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    """エンジンを作成する（SQLite の場合は WAL を有効化する）"""
+    new_engine = create_async_engine(
+        database_url,
+        echo=settings.environment == "development",
+    )
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine.sync_engine, "connect", _enable_sqlite_wal)
+    return new_engine
+
+
+engine = _create_engine(settings.database_url)
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
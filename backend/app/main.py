@@ -128,13 +128,15 @@ async def lifespan(app: FastAPI):
     yield
     # 終了時: リソース解放
     await event_manager.stop()
-    await close_db()
     await jma_service.close()
     await p2p_service.close()
     await tsunami_service.close()
     await warning_service.close()
     await volcano_service.close()
     await translator.close()
+    await push_service.close()
+    # 翻訳キャッシュの最終書き込みが終わってからDB接続を閉じる
+    await close_db()
     logger.info("災害対応AIシステム終了")
 
 
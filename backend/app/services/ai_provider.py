@@ -3,16 +3,30 @@ AI プロバイダー統合
 
 Gemini / Claude API の選択・呼び出し・JSON抽出を担当。
 """
+import asyncio
 import json
+import random
+import re
 from typing import Optional
 
 import httpx
+import orjson
 
 from .translation_templates import LANG_NAMES
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# AI API 用の接続プール上限。多言語の並列生成でも同じホストへの接続を使い回す
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# AI応答のマークダウンコードブロック（```json ... ```）から中身を取り出す
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
+# 生成APIで再試行するステータス（レート制限・一時的なサーバーエラー）
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+
 
 class AIProvider:
     """Gemini / Claude API プロバイダー"""
@@ -28,6 +42,7 @@ class AIProvider:
         anthropic_api_version: str,
         translate_timeout: httpx.Timeout,
         generate_timeout: httpx.Timeout,
+        max_concurrency: int = 8,
     ):
         self.ai_provider = ai_provider
         self.gemini_api_key = gemini_api_key
@@ -38,6 +53,18 @@ class AIProvider:
         self.translate_timeout = translate_timeout
         self.generate_timeout = generate_timeout
         self._client: Optional[httpx.AsyncClient] = None
+        # 多言語の並列生成でプロバイダーのレート制限を超えないよう同時リクエスト数を絞る
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # 翻訳・生成の呼び出し先は設定だけで決まるため、初期化時に1度だけ解決しておく
+        self._translate_impl = {
+            "gemini": self._translate_with_gemini,
+            "claude": self._translate_with_claude,
+        }.get(self.get_active_provider())
+        self._generate_impl = {
+            "gemini": self._generate_with_gemini,
+            "claude": self._generate_with_claude,
+        }.get(self.get_active_provider())
 
     # ------------------------------------------------------------------
     # HTTPクライアント管理
@@ -49,9 +76,11 @@ class AIProvider:
 
         クライアントが未生成またはクローズ済みの場合は新規作成する。
         接続プーリングを有効にするため、インスタンスを再利用する。
+        翻訳・警報文・安全ガイドの生成はすべてこのクライアントを共有し、
+        TLS ハンドシェイクは初回接続時の1回で済む。
         """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient()
+            self._client = httpx.AsyncClient(limits=_HTTP_LIMITS)
         return self._client
 
     async def close(self) -> None:
@@ -60,6 +89,39 @@ class AIProvider:
             await self._client.aclose()
             self._client = None
 
+    async def _post_with_retry(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str],
+        payload: dict,
+        timeout: httpx.Timeout,
+    ) -> httpx.Response:
+        """
+        同時実行数を制限してPOSTし、429/5xx は指数バックオフで再試行する
+
+        応答はストリーミングで受け取り、ステータス確認後に本文を読み込む。
+        再試行する応答は本文を待たずに破棄して接続を返す。
+        待機中はセマフォを解放し、他の言語の生成をブロックしない。
+        再試行を使い切った場合は最後の応答をそのまま返す。
+        """
+        client = self._get_client()
+        for attempt in range(_MAX_RETRIES + 1):
+            async with self._semaphore:
+                async with client.stream(
+                    "POST", url, headers=headers, json=payload, timeout=timeout
+                ) as response:
+                    if response.status_code not in _RETRY_STATUS or attempt == _MAX_RETRIES:
+                        await response.aread()
+                        return response
+            delay = min(2 ** attempt, 30) + random.random()
+            logger.warning(
+                f"AI API {response.status_code} - {delay:.1f}秒後に再試行 "
+                f"({attempt + 1}/{_MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+        return response
+
     # ------------------------------------------------------------------
     # プロバイダー選択
     # ------------------------------------------------------------------
@@ -97,12 +159,9 @@ class AIProvider:
         Returns:
             翻訳されたテキスト、失敗時None
         """
-        provider = self.get_active_provider()
-        if provider == "gemini":
-            return await self._translate_with_gemini(text, target_lang)
-        elif provider == "claude":
-            return await self._translate_with_claude(text, target_lang)
-        return None
+        if self._translate_impl is None:
+            return None
+        return await self._translate_impl(text, target_lang)
 
     async def _translate_with_gemini(self, text: str, target_lang: str) -> Optional[str]:
         """Gemini APIを使用して翻訳"""
@@ -192,25 +251,31 @@ class AIProvider:
     # テキスト生成（JSON応答）
     # ------------------------------------------------------------------
 
-    async def generate_json(self, prompt: str, max_tokens: int = 500) -> Optional[dict]:
+    async def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        system: Optional[str] = None,
+    ) -> Optional[dict]:
         """
         AI APIでテキスト生成し、JSONとしてパースして返す
 
         Args:
-            prompt: プロンプト
+            prompt: プロンプト（呼び出しごとに変わる部分）
             max_tokens: 最大トークン数
+            system: 呼び出し間で共通の指示（出力形式など）。
+                Claude ではプロンプトキャッシュの対象にする。
 
         Returns:
             パースされた辞書、失敗時None
         """
-        provider = self.get_active_provider()
-        if provider == "gemini":
-            return await self._generate_with_gemini(prompt, max_tokens)
-        elif provider == "claude":
-            return await self._generate_with_claude(prompt, max_tokens)
-        return None
+        if self._generate_impl is None:
+            return None
+        return await self._generate_impl(prompt, max_tokens, system)
 
-    async def _generate_with_gemini(self, prompt: str, max_tokens: int) -> Optional[dict]:
+    async def _generate_with_gemini(
+        self, prompt: str, max_tokens: int, system: Optional[str] = None
+    ) -> Optional[dict]:
         """Gemini APIでJSON生成"""
         try:
             url = (
@@ -218,20 +283,23 @@ class AIProvider:
                 f"{self.gemini_model}:generateContent"
             )
 
-            client = self._get_client()
-            response = await client.post(
+            payload = {
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {
+                    "maxOutputTokens": max_tokens,
+                    "temperature": 0.1 if max_tokens <= 500 else 0.2,
+                },
+            }
+            if system:
+                payload["systemInstruction"] = {"parts": [{"text": system}]}
+
+            response = await self._post_with_retry(
                 url,
                 headers={
                     "Content-Type": "application/json",
                     "x-goog-api-key": self.gemini_api_key,
                 },
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "maxOutputTokens": max_tokens,
-                        "temperature": 0.1 if max_tokens <= 500 else 0.2,
-                    },
-                },
+                payload=payload,
                 timeout=self.generate_timeout,
             )
 
@@ -250,27 +318,38 @@ class AIProvider:
             logger.error(f"Gemini API生成エラー: {e}", exc_info=True)
             return None
 
-    async def _generate_with_claude(self, prompt: str, max_tokens: int) -> Optional[dict]:
+    async def _generate_with_claude(
+        self, prompt: str, max_tokens: int, system: Optional[str] = None
+    ) -> Optional[dict]:
         """Claude APIでJSON生成"""
         try:
-            client = self._get_client()
-            response = await client.post(
+            payload = {
+                "model": self.anthropic_model,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            if system:
+                # 共通の指示はプロンプトキャッシュに載せ、言語・警報ごとの呼び出しで使い回す
+                payload["system"] = [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ]
+
+            response = await self._post_with_retry(
                 "https://api.anthropic.com/v1/messages",
                 headers={
                     "Content-Type": "application/json",
                     "X-API-Key": self.anthropic_api_key,
                     "anthropic-version": self.anthropic_api_version,
                 },
-                json={
-                    "model": self.anthropic_model,
-                    "max_tokens": max_tokens,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
+                payload=payload,
                 timeout=self.generate_timeout,
             )
 
             if response.status_code == 200:
                 data = response.json()
+                usage = data.get("usage", {})
+                if usage.get("cache_read_input_tokens"):
+                    logger.debug(f"Claude プロンプトキャッシュ利用: {usage['cache_read_input_tokens']} tokens")
                 content = data["content"][0]["text"].strip()
                 result = self.extract_json(content)
                 if result is None:
@@ -293,26 +372,28 @@ class AIProvider:
         """
         AI応答からJSONを堅牢に抽出する（3段階フォールバック）
 
+        パースには orjson を使用する（orjson.JSONDecodeError は
+        json.JSONDecodeError のサブクラスのため、各段の例外処理はそのまま機能する）。
+
         Args:
             content: AI応答テキスト
 
         Returns:
             パースされた辞書、失敗時はNone
         """
-        # 第1段階: 直接パース
-        try:
-            return json.loads(content)
-        except (json.JSONDecodeError, ValueError):
-            pass
+        # 第1段階: 直接パース（コードブロックを含む応答は失敗が確実なので省略）
+        if "```" not in content:
+            try:
+                return orjson.loads(content)
+            except (json.JSONDecodeError, ValueError):
+                pass
 
         # 第2段階: マークダウンコードブロック抽出
-        if "```" in content:
+        match = _JSON_FENCE_RE.search(content)
+        if match:
             try:
-                code_block = content.split("```")[1]
-                if code_block.startswith("json"):
-                    code_block = code_block[4:]
-                return json.loads(code_block.strip())
-            except (json.JSONDecodeError, ValueError, IndexError):
+                return orjson.loads(match.group(1))
+            except (json.JSONDecodeError, ValueError):
                 pass
 
         # 第3段階: ブレース抽出（最初の { から最後の } まで）
@@ -320,7 +401,7 @@ class AIProvider:
         last_brace = content.rfind("}")
         if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
             try:
-                result = json.loads(content[first_brace:last_brace + 1])
+                result = orjson.loads(content[first_brace:last_brace + 1])
                 logger.warning("JSON fallback extraction used")
                 return result
             except (json.JSONDecodeError, ValueError):
@@ -2,6 +2,7 @@
 気象庁API連携サービス
 """
 import httpx
+import orjson
 from typing import Optional
 from ..models import WeatherInfo, DisasterAlert
 from ..utils.logger import get_logger
@@ -50,7 +51,7 @@ class JMAService:
         try:
             response = await client.get(url, timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return WeatherInfo(
                 area=data.get("targetArea", ""),
@@ -1447,9 +1447,9 @@ def get_location_translation(location: str, target_lang: str) -> str | None:
     Returns:
         翻訳された地名（見つからない場合はNone）
     """
-    if location in LOCATION_TRANSLATIONS:
-        return LOCATION_TRANSLATIONS[location].get(target_lang)
-    return None
+    # 完全一致の dict 引き1回で済ませる（部分一致での置換は誤訳の原因になるため行わない）
+    translations = LOCATION_TRANSLATIONS.get(location)
+    return translations.get(target_lang) if translations is not None else None
 
 
 def get_all_locations() -> list[str]:
@@ -6,12 +6,14 @@ VAPID認証によるWeb Push通知の送信・サブスクリプション管理
 地域セグメント通知に対応。
 """
 import asyncio
-import json
+import functools
 import secrets
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Collection, Optional
 
+import orjson
 from sqlalchemy import select, delete, func
 from sqlalchemy.exc import IntegrityError
 
@@ -128,21 +130,49 @@ class PushNotificationService:
         "en": {"extreme": "[EMERGENCY] ", "high": "[WARNING] ", "medium": "[ADVISORY] ", "low": ""},
     }
 
+    # 地震通知の震度閾値判定に使う、重要度からの推定震度
+    SEVERITY_TO_INTENSITY = {"low": 1, "medium": 3, "high": 5, "extreme": 6}
+
     def __init__(self):
         self._vapid_public_key = settings.vapid_public_key
         self._vapid_private_key = settings.vapid_private_key
         self._vapid_claims_email = settings.vapid_claims_email
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 設定・依存の有無は起動後に変わらないため、利用可否は1回だけ判定する
+        self._is_enabled = self._compute_enabled(PYWEBPUSH_AVAILABLE)
 
-    @property
-    def is_enabled(self) -> bool:
-        """プッシュ通知が利用可能かどうか"""
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """webpush 送信用のスレッドプールを取得（遅延初期化）
+
+        既定の executor は min(32, CPU数+4) スレッドで他の to_thread とも共有されるため、
+        MAX_CONCURRENT_PUSH 件の同時送信を確実に行えるよう専用のプールを使う。
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_PUSH, thread_name_prefix="webpush"
+            )
+        return self._executor
+
+    async def close(self) -> None:
+        """送信用スレッドプールを解放する"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _compute_enabled(self, pywebpush_available: bool) -> bool:
+        """pywebpush と VAPID 鍵がすべて揃っているか判定する"""
         return bool(
-            PYWEBPUSH_AVAILABLE
+            pywebpush_available
             and self._vapid_public_key
             and self._vapid_private_key
             and self._vapid_claims_email
         )
 
+    @property
+    def is_enabled(self) -> bool:
+        """プッシュ通知が利用可能かどうか（__init__ で判定済みの値）"""
+        return self._is_enabled
+
     async def subscribe(
         self,
         subscription: PushSubscription,
@@ -170,7 +200,7 @@ class PushNotificationService:
         Returns:
             tuple[bool, Optional[str]]: (登録成功フラグ, クライアントが保管すべき management_token)
         """
-        regions_json = json.dumps(preferred_regions) if preferred_regions else None
+        regions_json = orjson.dumps(preferred_regions).decode() if preferred_regions else None
         try:
             async with async_session() as session:
                 # 既存のサブスクリプションを確認（重複防止）
@@ -242,6 +272,88 @@ class PushNotificationService:
             logger.error(f"サブスクリプション登録エラー: {e}")
             raise PushNotificationError(f"サブスクリプション登録に失敗しました: {e}")
 
+    async def subscribe_many(
+        self,
+        subscriptions: list[PushSubscription],
+        language: str = "ja",
+        preferred_regions: list[str] | None = None,
+        earthquake_threshold: int = 3,
+        tsunami_alerts: bool = True,
+        weather_alerts: bool = True,
+    ) -> dict[str, str]:
+        """
+        複数のサブスクリプションを1トランザクションでまとめて登録
+
+        既存行の確認は1回の SELECT（endpoint IN ...）で行い、更新・新規登録を
+        まとめて1回の commit で書き込む。同じ endpoint が複数あれば後のものを採る。
+        登録が競合した場合（IntegrityError）は subscribe() で1件ずつ登録し直す。
+
+        Args:
+            subscriptions: Web Push サブスクリプション情報のリスト
+            language 以降: subscribe() と同じ（全件に同じ設定を適用する）
+
+        Returns:
+            dict[str, str]: endpoint -> management_token（件数は len() で得る）
+        """
+        if not subscriptions:
+            return {}
+        by_endpoint = {sub.endpoint: sub for sub in subscriptions}
+        regions_json = orjson.dumps(preferred_regions).decode() if preferred_regions else None
+        tokens: dict[str, str] = {}
+        try:
+            async with async_session() as session:
+                stmt = select(PushSubscriptionRow).where(
+                    PushSubscriptionRow.endpoint.in_(by_endpoint)
+                )
+                existing = {row.endpoint: row for row in (await session.execute(stmt)).scalars()}
+
+                now = datetime.now(timezone.utc)
+                for endpoint, sub in by_endpoint.items():
+                    row = existing.get(endpoint)
+                    if row is None:
+                        row = PushSubscriptionRow(endpoint=endpoint)
+                        session.add(row)
+                    else:
+                        row.updated_at = now
+                    row.key_p256dh = sub.keys.get("p256dh", "")
+                    row.key_auth = sub.keys.get("auth", "")
+                    row.language = language
+                    row.preferred_regions = regions_json
+                    row.earthquake_threshold = earthquake_threshold
+                    row.tsunami_alerts = tsunami_alerts
+                    row.weather_alerts = weather_alerts
+                    # 新規・legacy 行（token=null）には発行し、既存の token はそのまま返す
+                    if row.management_token is None:
+                        row.management_token = secrets.token_urlsafe(32)
+                    tokens[endpoint] = row.management_token
+
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    await session.rollback()
+                    tokens = {}
+            if not tokens:
+                # 他リクエストとの競合INSERT — 1件ずつ既存行を確認しながら登録する
+                logger.info("サブスクリプション一括登録で競合発生。個別登録にフォールバック")
+                for sub in by_endpoint.values():
+                    _, token = await self.subscribe(
+                        sub,
+                        language=language,
+                        preferred_regions=preferred_regions,
+                        earthquake_threshold=earthquake_threshold,
+                        tsunami_alerts=tsunami_alerts,
+                        weather_alerts=weather_alerts,
+                    )
+                    if token is not None:
+                        tokens[sub.endpoint] = token
+            logger.info("サブスクリプション一括登録: %d件", len(tokens))
+            return tokens
+        except PushNotificationError:
+            raise
+        except Exception as e:
+            logger.error(f"サブスクリプション一括登録エラー: {e}")
+            raise PushNotificationError(f"サブスクリプション一括登録に失敗しました: {e}")
+
     def _verify_token(self, row: Optional[PushSubscriptionRow], endpoint: str, token: str) -> None:
         """management_token の検証共通処理
 
@@ -312,7 +424,7 @@ class PushNotificationService:
                 if "language" in kwargs and kwargs["language"] is not None:
                     existing.language = kwargs["language"]
                 if "preferred_regions" in kwargs and kwargs["preferred_regions"] is not None:
-                    existing.preferred_regions = json.dumps(kwargs["preferred_regions"])
+                    existing.preferred_regions = orjson.dumps(kwargs["preferred_regions"]).decode()
                 if "earthquake_threshold" in kwargs and kwargs["earthquake_threshold"] is not None:
                     existing.earthquake_threshold = kwargs["earthquake_threshold"]
                 if "tsunami_alerts" in kwargs and kwargs["tsunami_alerts"] is not None:
@@ -362,8 +474,8 @@ class PushNotificationService:
                 regions: list[str] = []
                 if row.preferred_regions:
                     try:
-                        regions = json.loads(row.preferred_regions)
-                    except (json.JSONDecodeError, TypeError):
+                        regions = orjson.loads(row.preferred_regions)
+                    except (orjson.JSONDecodeError, TypeError):
                         regions = []
 
                 return {
@@ -380,12 +492,14 @@ class PushNotificationService:
             logger.error(f"通知設定取得エラー: {e}")
             return None
 
-    def _regions_match(self, user_regions_json: Optional[str], affected_areas: list[str]) -> bool:
+    def _regions_match(
+        self, user_regions_json: Optional[str], affected_areas: Collection[str]
+    ) -> bool:
         """ユーザーの監視地域と影響地域が一致するかチェック
 
         Args:
             user_regions_json: ユーザーの監視地域（JSON文字列）
-            affected_areas: 影響を受ける地域コードリスト
+            affected_areas: 影響を受ける地域コード（frozenset を渡せば変換を省ける）
 
         Returns:
             bool: 一致する場合True（地域未設定は全国監視とみなす）
@@ -393,9 +507,9 @@ class PushNotificationService:
         if not user_regions_json:
             return True  # 地域未設定 = 全国監視
         try:
-            user_regions = json.loads(user_regions_json)
-            return bool(set(user_regions) & set(affected_areas))
-        except (json.JSONDecodeError, TypeError):
+            user_regions = orjson.loads(user_regions_json)
+            return not frozenset(affected_areas).isdisjoint(user_regions)
+        except (orjson.JSONDecodeError, TypeError):
             return True  # パースエラー = 全国監視とみなす
 
     async def unsubscribe(self, endpoint: str, token: str) -> bool:
@@ -463,14 +577,15 @@ class PushNotificationService:
     @staticmethod
     def _build_payload(title: str, body: str, url: str) -> str:
         """Web Push 通知ペイロード（JSON文字列）を生成する"""
-        return json.dumps({
+        # orjson は常にUTF-8で出力する（ensure_ascii=False 相当）
+        return orjson.dumps({
             "title": title,
             "body": body,
             "url": url,
             "tag": "disaster-alert",
             "icon": "/icons/icon-192x192.png",
             "badge": "/icons/badge-72x72.png",
-        }, ensure_ascii=False)
+        }).decode()
 
     async def _dispatch_push(self, targets: list[dict], payload: str) -> int:
         """ペイロードを全送信先に並列送信し、無効サブスクリプションをDBから削除する
@@ -486,20 +601,23 @@ class PushNotificationService:
             "sub": f"mailto:{self._vapid_claims_email}",
         }
         _sem = asyncio.Semaphore(self.MAX_CONCURRENT_PUSH)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
 
         async def _send_one(sub_info: dict) -> tuple[bool, Optional[str]]:
             async with _sem:
                 try:
-                    # webpush は同期APIのため to_thread でイベントループをブロックしない
-                    await asyncio.to_thread(
-                        webpush,
-                        subscription_info={
-                            "endpoint": sub_info["endpoint"],
-                            "keys": sub_info["keys"],
-                        },
-                        data=payload,
-                        vapid_private_key=self._vapid_private_key,
-                        vapid_claims=vapid_claims,
+                    # webpush は同期APIのため専用スレッドプールでイベントループをブロックしない
+                    # 送信先は {"endpoint", "keys"} の形で渡されるため、そのまま使う
+                    await loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            webpush,
+                            subscription_info=sub_info,
+                            data=payload,
+                            vapid_private_key=self._vapid_private_key,
+                            vapid_claims=vapid_claims,
+                        ),
                     )
                     return (True, None)
                 except WebPushException as e:
@@ -568,18 +686,18 @@ class PushNotificationService:
                 "keys": subscription.keys,
             }]
         else:
-            # DBから全サブスクリプションを取得
+            # DBから全サブスクリプションを取得（送信に使う列だけ。ORM オブジェクトは作らない）
             try:
                 async with async_session() as session:
-                    stmt = select(PushSubscriptionRow)
+                    stmt = select(
+                        PushSubscriptionRow.endpoint,
+                        PushSubscriptionRow.key_p256dh,
+                        PushSubscriptionRow.key_auth,
+                    )
                     result = await session.execute(stmt)
-                    rows = result.scalars().all()
                     targets = [
-                        {
-                            "endpoint": row.endpoint,
-                            "keys": {"p256dh": row.key_p256dh, "auth": row.key_auth},
-                        }
-                        for row in rows
+                        {"endpoint": endpoint, "keys": {"p256dh": p256dh, "auth": auth}}
+                        for endpoint, p256dh, auth in result
                     ]
             except Exception as e:
                 logger.error(f"サブスクリプション取得エラー: {e}")
@@ -650,17 +768,36 @@ class PushNotificationService:
         safe_alert_type = alert_type if alert_type in VALID_ALERT_TYPES else "unknown"
         payload = self._build_payload(title, message, f"/?alert={safe_alert_type}")
 
+        # 地震の場合の推定震度（severity から推定。行ごとではなく1回だけ求める）
+        estimated_intensity = self.SEVERITY_TO_INTENSITY.get(severity, 3)
+
         # DBから全サブスクリプションを取得しフィルタリング
         targets: list[dict] = []
+        affected = frozenset(affected_areas)
+        # 監視地域の JSON 文字列 -> 一致判定。同じ地域設定の登録者が多いため、
+        # 行ごとの JSON デコードと集合演算を設定値ごとに1回にする
+        region_matches: dict[Optional[str], bool] = {}
         try:
             async with async_session() as session:
-                stmt = select(PushSubscriptionRow)
+                # 判定と送信に使う列だけを取得する（ORM オブジェクトは作らない）
+                stmt = select(
+                    PushSubscriptionRow.endpoint,
+                    PushSubscriptionRow.key_p256dh,
+                    PushSubscriptionRow.key_auth,
+                    PushSubscriptionRow.preferred_regions,
+                    PushSubscriptionRow.earthquake_threshold,
+                    PushSubscriptionRow.tsunami_alerts,
+                    PushSubscriptionRow.weather_alerts,
+                )
                 result = await session.execute(stmt)
-                rows = result.scalars().all()
 
-                for row in rows:
+                for row in result:
                     # 地域フィルタ: 監視地域が一致するかチェック
-                    if not self._regions_match(row.preferred_regions, affected_areas):
+                    matched = region_matches.get(row.preferred_regions)
+                    if matched is None:
+                        matched = self._regions_match(row.preferred_regions, affected)
+                        region_matches[row.preferred_regions] = matched
+                    if not matched:
                         continue
 
                     # アラート種別フィルタ
@@ -671,13 +808,6 @@ class PushNotificationService:
 
                     # 地震の場合: 震度閾値チェック（severityから推定）
                     if alert_type == "earthquake":
-                        severity_to_intensity = {
-                            "low": 1,
-                            "medium": 3,
-                            "high": 5,
-                            "extreme": 6,
-                        }
-                        estimated_intensity = severity_to_intensity.get(severity, 3)
                         if estimated_intensity < row.earthquake_threshold:
                             continue
 
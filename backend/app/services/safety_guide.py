@@ -4,7 +4,6 @@
 災害種別に応じた多言語安全ガイドをAI APIで生成。
 キャッシュ連携あり。
 """
-import json
 from typing import Optional
 
 from .ai_provider import AIProvider
@@ -15,10 +14,46 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 安全ガイド生成用の共通指示（system。全言語・全災害種別で同一のためプロンプトキャッシュの対象）
+_SYSTEM_PROMPT = """You write disaster safety guides for people in Japan, in the language the user requests.
+
+Return ONLY a JSON object with these exact keys (no markdown, no explanation):
+{
+  "title": "Safety guide title in the requested language",
+  "summary": "Brief 1-2 sentence summary of what to do",
+  "immediate_actions": ["action 1", "action 2", "action 3", "action 4", "action 5"],
+  "preparation_tips": ["tip 1", "tip 2", "tip 3"],
+  "evacuation_info": "Information about when and where to evacuate",
+  "emergency_contacts": "Emergency numbers and resources (use Japan numbers: Police 110, Fire/Ambulance 119, Coast Guard 118)",
+  "additional_notes": "Any additional important information"
+}
+
+Important guidelines:
+- All text must be in the requested language
+- For "easy_ja", use simple hiragana and basic vocabulary with spaces between words
+- immediate_actions should be specific, actionable steps in order of priority
+- Include Japan-specific emergency information
+- Be culturally appropriate and practical
+- Focus on life-saving information first"""
+
+# 安全ガイド生成用プロンプト（可変部分のみ format で埋める）
+_PROMPT_TEMPLATE = """Generate a comprehensive safety guide for {disaster_type}{location_context} in {target_name}.
+
+Severity level: {severity_desc}
+All text must be in {target_name}."""
+
 
 class SafetyGuideGenerator:
     """災害安全ガイド生成"""
 
+    # プロンプトに埋める重要度の説明
+    _SEVERITY_CONTEXT = {
+        "low": "minor risk, general awareness needed",
+        "medium": "moderate risk, caution advised",
+        "high": "serious risk, immediate precautions needed",
+        "extreme": "life-threatening emergency, immediate action required",
+    }
+
     def __init__(self, ai_provider: AIProvider, cache: TranslationCache):
         self._ai = ai_provider
         self._cache = cache
@@ -44,25 +79,23 @@ class SafetyGuideGenerator:
         """
         # キャッシュ確認
         cache_key = self._cache.make_key(f"safety:{disaster_type}:{location}:{severity}", target_lang)
-        cached = self._cache.get(cache_key)
-        if cached:
-            try:
-                cached_data = json.loads(cached)
-                cached_data["cached"] = True
-                return cached_data
-            except json.JSONDecodeError:
-                pass
+        cached_data = self._cache.get_json(cache_key)
+        if cached_data is not None:
+            cached_data["cached"] = True
+            return cached_data
 
         # AI APIで生成
         provider = self._ai.get_active_provider()
         if provider:
             try:
                 prompt = self._build_prompt(disaster_type, target_lang, location, severity)
-                result = await self._ai.generate_json(prompt, max_tokens=1500)
+                result = await self._ai.generate_json(
+                    prompt, max_tokens=1500, system=_SYSTEM_PROMPT
+                )
                 if result:
                     result["cached"] = False
                     # キャッシュに保存
-                    await self._cache.set(cache_key, json.dumps(result, ensure_ascii=False))
+                    await self._cache.set_json(cache_key, result)
                     return result
             except Exception as e:
                 logger.error(f"安全ガイド生成エラー ({provider}): {e}", exc_info=True)
@@ -81,37 +114,12 @@ class SafetyGuideGenerator:
         # H-1 defense in depth: 未知の target_lang を生で f-string に埋めない
         target_name = LANG_NAMES.get(target_lang, "English")
 
-        severity_context = {
-            "low": "minor risk, general awareness needed",
-            "medium": "moderate risk, caution advised",
-            "high": "serious risk, immediate precautions needed",
-            "extreme": "life-threatening emergency, immediate action required",
-        }
-        severity_desc = severity_context.get(severity, "moderate risk")
-        location_context = f" in {location}" if location else ""
-
-        return f"""Generate a comprehensive safety guide for {disaster_type}{location_context} in {target_name}.
-
-Severity level: {severity_desc}
-
-Return ONLY a JSON object with these exact keys (no markdown, no explanation):
-{{
-  "title": "Safety guide title in {target_name}",
-  "summary": "Brief 1-2 sentence summary of what to do",
-  "immediate_actions": ["action 1", "action 2", "action 3", "action 4", "action 5"],
-  "preparation_tips": ["tip 1", "tip 2", "tip 3"],
-  "evacuation_info": "Information about when and where to evacuate",
-  "emergency_contacts": "Emergency numbers and resources (use Japan numbers: Police 110, Fire/Ambulance 119, Coast Guard 118)",
-  "additional_notes": "Any additional important information"
-}}
-
-Important guidelines:
-- All text must be in {target_name}
-- For "easy_ja", use simple hiragana and basic vocabulary with spaces between words
-- immediate_actions should be specific, actionable steps in order of priority
-- Include Japan-specific emergency information
-- Be culturally appropriate and practical
-- Focus on life-saving information first"""
+        return _PROMPT_TEMPLATE.format(
+            disaster_type=disaster_type,
+            location_context=f" in {location}" if location else "",
+            target_name=target_name,
+            severity_desc=self._SEVERITY_CONTEXT.get(severity, "moderate risk"),
+        )
 
     @staticmethod
     def _get_fallback(
@@ -293,6 +293,20 @@ GUIDE_FIELDS = (
     "additional_notes",
 )
 
+# 言語ごとの、災害種別に依存しない項目（呼び出しのたびに組み立てない）
+_STATIC_FIELDS: dict[str, dict] = {
+    lang: {
+        "evacuation_info": template["evacuation_info"],
+        "emergency_contacts": template["emergency_contacts"],
+        "additional_notes": template["additional_notes"],
+        "cached": False,
+        # AI 生成ではなく静的フォールバックであることを呼び出し側が判別できるようにする
+        "fallback": True,
+        "lang": lang,
+    }
+    for lang, template in SAFETY_GUIDE_FALLBACK.items()
+}
+
 
 def localized_disaster_name(disaster_type: str, target_lang: str) -> str:
     """災害種別名をその言語で返す。未知の種別は種別コードをそのまま返す。"""
@@ -313,17 +327,11 @@ def build_fallback_guide(disaster_type: str, target_lang: Optional[str]) -> dict
     template = SAFETY_GUIDE_FALLBACK[lang]
     disaster_name = localized_disaster_name(disaster_type, lang)
 
-    guide = {
+    # リストは呼び出し側で書き換えられても定型文に波及しないようコピーする
+    return {
         "title": template["title"].format(disaster=disaster_name),
         "summary": template["summary"].format(disaster=disaster_name),
         "immediate_actions": list(template["immediate_actions"]),
         "preparation_tips": list(template["preparation_tips"]),
-        "evacuation_info": template["evacuation_info"],
-        "emergency_contacts": template["emergency_contacts"],
-        "additional_notes": template["additional_notes"],
+        **_STATIC_FIELDS[lang],
     }
-    guide["cached"] = False
-    # AI 生成ではなく静的フォールバックであることを呼び出し側が判別できるようにする
-    guide["fallback"] = True
-    guide["lang"] = lang
-    return guide
@@ -4,8 +4,13 @@
 """
 import csv
 import hashlib
+import heapq
 import math
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
 import json
+from array import array
 from typing import Optional
 from pathlib import Path
 from ..models import ShelterInfo
@@ -27,8 +32,22 @@ class ShelterService:
         self._csv_path = settings.shelter_csv_path
         self._shelters_cache: list[ShelterInfo] = []
         self._shelter_index: dict[str, ShelterInfo] = {}
+        # 距離計算用の座標配列（SoA: 緯度の昇順。緯度経度はラジアン）
+        # _order[k] は k 番目の座標が _shelters_cache の何番目かを表す
+        self._order = array("l")
+        self._lat_rad = array("d")
+        self._lon_rad = array("d")
+        self._cos_lat = array("d")
+        # 災害種別のビットマスク（_shelters_cache と同じ順。ビットは _TYPE_BITS）
+        self._type_mask = array("B")
         self._load_shelter_data()
 
+    # 地球の半径（km）
+    EARTH_RADIUS_KM = 6371.0
+
+    # CSV の災害種別列で「対応」を表す値
+    _TRUTHY_VALUES = frozenset({"1", "○", "TRUE", "true", "True", "yes", "Yes"})
+
     # 災害種別マッピング
     DISASTER_TYPES = {
         "flood": "洪水",
@@ -41,6 +60,8 @@ class ShelterService:
         "volcano": "火山現象",
     }
 
+    # 災害種別 -> _type_mask のビット
+    _TYPE_BITS = {disaster_type: 1 << bit for bit, disaster_type in enumerate(DISASTER_TYPES)}
 
     def _load_shelter_data(self):
         """避難所データをロード（CSV > JSON > ハードコードサンプルの優先順位）"""
@@ -70,6 +91,39 @@ class ShelterService:
             self._shelters_cache = self._get_sample_shelters()
         finally:
             self._shelter_index = {s.id: s for s in self._shelters_cache}
+            self._build_coordinate_arrays()
+
+    def _build_coordinate_arrays(self) -> None:
+        """避難所の座標を緯度順に並べたラジアンの配列にまとめる
+
+        検索ごとの radians/cos を省き、緯度の二分探索で検索半径の帯だけを走査できるようにする。
+        """
+        # 座標はまず元の順で配列に取り出し、並べ替えは配列の添字で行う
+        # （避難所ごとの一時オブジェクトを作らない）
+        shelters = self._shelters_cache
+        lat_deg = array("d", (s.latitude for s in shelters))
+        lon_deg = array("d", (s.longitude for s in shelters))
+        order = array("l", sorted(range(len(shelters)), key=lat_deg.__getitem__))
+        self._order = order
+        self._lat_rad = array("d", (math.radians(lat_deg[i]) for i in order))
+        self._lon_rad = array("d", (math.radians(lon_deg[i]) for i in order))
+        self._cos_lat = array("d", map(math.cos, self._lat_rad))
+        type_bits = self._TYPE_BITS
+        self._type_mask = array(
+            "B", (sum(type_bits.get(t, 0) for t in set(s.types)) for s in shelters)
+        )
+
+    def _type_matcher(self, disaster_type: str):
+        """_shelters_cache の添字が disaster_type に対応するか判定する関数を返す
+
+        既知の種別はビットマスク配列を引くだけで判定し、ShelterInfo.types のリストを走査しない。
+        """
+        bit = self._TYPE_BITS.get(disaster_type)
+        if bit is not None:
+            type_mask = self._type_mask
+            return lambda i: type_mask[i] & bit
+        shelters = self._shelters_cache
+        return lambda i: disaster_type in shelters[i].types
 
     def _load_shelters_from_csv(self, csv_path: str) -> list[ShelterInfo]:
         """
@@ -105,14 +159,37 @@ class ShelterService:
 
         shelters: list[ShelterInfo] = []
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                width = len(header)
+                # 列名 -> 列番号（同名の列は DictReader と同じく後ろの列を使う）
+                columns = {col_name: i for i, col_name in enumerate(header)}
+
+                def column(*candidates: str) -> int:
+                    # 存在しない列は、各行の末尾に足す空セル（列番号 width）を指す
+                    return next((columns[c] for c in candidates if c in columns), width)
+
+                pick = itemgetter(column("施設名", "名称"), column("住所", "所在地"), column("緯度"), column("経度"))
+                # CSV に存在する災害種別列だけを (列番号, typesキー) にしておく
+                type_cols = [
+                    (columns[col_name], type_key)
+                    for col_name, type_key in disaster_column_map.items()
+                    if col_name in columns
+                ]
+                truthy = self._TRUTHY_VALUES
+                padding = [""] * width
+                sha256 = hashlib.sha256
+
                 for idx, row in enumerate(reader):
+                    if not row:
+                        continue
+                    # 列の過不足をヘッダーに揃え、存在しない列用の空セルを足す
+                    if len(row) != width:
+                        row = (row + padding)[:width]
+                    row.append("")
                     try:
-                        name = row.get("施設名", row.get("名称", "")).strip()
-                        address = row.get("住所", row.get("所在地", "")).strip()
-                        lat_str = row.get("緯度", "").strip()
-                        lon_str = row.get("経度", "").strip()
+                        name, address, lat_str, lon_str = map(str.strip, pick(row))
 
                         if not name or not lat_str or not lon_str:
                             continue
@@ -122,30 +199,30 @@ class ShelterService:
 
                         # 災害種別を判定（値が "1", "○", "TRUE" 等なら対応）
                         types: list[str] = []
-                        for col_name, type_key in disaster_column_map.items():
-                            val = row.get(col_name, "").strip()
-                            if val in ("1", "○", "TRUE", "true", "True", "yes", "Yes"):
-                                if type_key not in types:
-                                    types.append(type_key)
+                        for col, type_key in type_cols:
+                            if row[col].strip() in truthy and type_key not in types:
+                                types.append(type_key)
 
                         # 一意なIDを生成（施設名+緯度経度からハッシュ）
                         raw_id = f"{name}_{latitude}_{longitude}"
-                        shelter_id = f"csv_{hashlib.sha256(raw_id.encode()).hexdigest()[:8]}"
+                        shelter_id = f"csv_{sha256(raw_id.encode()).hexdigest()[:8]}"
 
+                        # facilities を明示して、既定値（リスト）の検証時コピーを省く
                         shelters.append(ShelterInfo(
                             id=shelter_id,
                             name=name,
                             address=address,
                             latitude=latitude,
                             longitude=longitude,
+                            facilities=[],
                             types=types,
                             is_open=True,
                         ))
-                    except (ValueError, KeyError) as row_err:
+                    except ValueError as row_err:
                         logger.warning(f"CSV行 {idx + 1} の解析スキップ: {row_err}")
                         continue
 
-            logger.info(f"CSVから{len(shelters)}件の避難所を読み込みました: {csv_path}")
+            logger.info(f"CSVから{len(shelters)}件の避難所を読み込みました: {path}")
         except Exception as e:
             logger.error(f"CSV読み込みエラー: {e}", exc_info=True)
             return []
@@ -233,25 +310,43 @@ class ShelterService:
         Returns:
             list[ShelterInfo]: 近い順にソートされた避難所リスト
         """
-        shelters_with_distance = []
-
-        for shelter in self._shelters_cache:
-            # 距離計算（Haversine公式）
-            distance = self._calculate_distance(lat, lon, shelter.latitude, shelter.longitude)
-
-            if distance <= radius_km:
-                # 災害種別フィルタリング
-                if disaster_type and disaster_type not in shelter.types:
-                    continue
-
-                shelter_copy = shelter.model_copy()
-                shelter_copy.distance = round(distance, 2)
-                shelters_with_distance.append(shelter_copy)
-
-        # 距離順にソート
-        shelters_with_distance.sort(key=lambda s: s.distance or float('inf'))
-
-        return shelters_with_distance[:limit]
+        # 距離計算（Haversine公式）。緯度順の座標配列を二分探索し、
+        # 緯度差が検索半径以内の帯（半径外と確定しない範囲）だけを走査する
+        shelters = self._shelters_cache
+        lat_rad, lon_rad, cos_lat, order = self._lat_rad, self._lon_rad, self._cos_lat, self._order
+        sin, sqrt, atan2 = math.sin, math.sqrt, math.atan2
+        lat1 = math.radians(lat)
+        lon1 = math.radians(lon)
+        cos_lat1 = math.cos(lat1)
+        diameter = 2 * self.EARTH_RADIUS_KM
+        max_delta_lat = radius_km / self.EARTH_RADIUS_KM
+
+        start = bisect_left(lat_rad, lat1 - max_delta_lat)
+        stop = bisect_right(lat_rad, lat1 + max_delta_lat)
+        matches_type = self._type_matcher(disaster_type) if disaster_type else None
+
+        candidates: list[tuple[float, int]] = []
+        for k in range(start, stop):
+            i = order[k]
+            # 災害種別フィルタリング（距離計算の前に除外する）
+            if matches_type is not None and not matches_type(i):
+                continue
+            a = (
+                sin((lat_rad[k] - lat1) / 2) ** 2
+                + cos_lat1 * cos_lat[k] * sin((lon_rad[k] - lon1) / 2) ** 2
+            )
+            distance = diameter * atan2(sqrt(a), sqrt(1 - a))
+            if distance > radius_km:
+                continue
+            candidates.append((distance, i))
+
+        # 距離順に上位 limit 件だけを取り出し、その分だけコピーを作る
+        nearest = []
+        for distance, i in heapq.nsmallest(limit, candidates):
+            shelter_copy = shelters[i].model_copy()
+            shelter_copy.distance = round(distance, 2)
+            nearest.append(shelter_copy)
+        return nearest
 
     def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -302,8 +397,9 @@ class ShelterService:
         Returns:
             list[ShelterInfo]: 該当する避難所リスト
         """
-        filtered = [s for s in self._shelters_cache if disaster_type in s.types]
-        return filtered[:limit]
+        matches_type = self._type_matcher(disaster_type)
+        matched = (s for i, s in enumerate(self._shelters_cache) if matches_type(i))
+        return list(islice(matched, limit))
 
     def get_shelter_by_id(self, shelter_id: str) -> Optional[ShelterInfo]:
         """
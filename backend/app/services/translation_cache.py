@@ -5,12 +5,22 @@ L1: インメモリdict（高速読み取り）
 L2: SQLAlchemy DB（永続化）
 
 読み取り（get / contains）は同期でインメモリdictを参照。
-書き込み（set）は非同期でインメモリdict + DBに保存。
-起動時に init() でDBからインメモリdictを復元。
+書き込み（set）はインメモリdictに即時反映し、DBへは FLUSH_INTERVAL 秒ごとに
+変更キーをまとめて1トランザクションで書き込む（write-behind）。
+起動時に init() でDBからインメモリdictを復元し、終了時に close() で未保存分を書き出す。
+
+JSON値（警報テキスト・安全ガイド）は get_json / set_json 経由で扱い、
+デコード済みの dict をインメモリに保持してヒット毎のJSONデコードを省く。
+
+get_or_load / get_or_load_json はキャッシュミス時にだけ AI 呼び出しを行い、
+同じキーへの同時ミスは1回の呼び出しにまとめる。
 """
+import asyncio
 import hashlib
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
 
+import orjson
 from sqlalchemy import select
 
 from ..utils.logger import get_logger
@@ -21,9 +31,21 @@ logger = get_logger(__name__)
 class TranslationCache:
     """DB永続化翻訳キャッシュ（L1: dict / L2: DB）"""
 
+    # DBへの書き込みをまとめる間隔（秒）
+    FLUSH_INTERVAL = 5.0
+    # 書き込み失敗時の再試行間隔の上限（秒。失敗のたびに間隔を倍にする）
+    MAX_FLUSH_BACKOFF = 300.0
+
     def __init__(self) -> None:
         """初期化（インメモリdictのみ。DB読み込みは init() で行う）"""
         self._cache: dict[str, str] = {}
+        # DB未反映のキーと、遅延書き込みタスク
+        self._dirty: set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # L1 の JSON 値のデコード済みオブジェクト（get_json のヒット時にJSONデコードを省く）
+        self._objects: dict[str, dict] = {}
+        # キャッシュミス中のキー -> 取得中の Future（同時ミスを1回の取得にまとめる）
+        self._inflight: dict[str, asyncio.Future] = {}
 
     async def init(self) -> None:
         """DBからキャッシュを復元する（起動時に1回呼び出す）"""
@@ -41,10 +63,13 @@ class TranslationCache:
             logger.warning("DB読み込み失敗（インメモリのみで動作）: %s", e)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def make_key(text: str, target_lang: str) -> str:
         """
         キャッシュキーを生成（SHA-256ハッシュ）
 
+        同じ地名・定型文が警報のたびに繰り返し渡されるため、結果をメモ化する。
+
         Args:
             text: 元テキスト
             target_lang: 翻訳先言語コード
@@ -68,16 +93,46 @@ class TranslationCache:
 
     async def set(self, key: str, value: str) -> None:
         """
-        キャッシュに値を保存（インメモリdict + DB）
+        キャッシュに値を保存（インメモリdictに即時保存、DBへは遅延書き込み）
 
         Args:
             key: キャッシュキー
             value: 保存する値
         """
-        # L1: インメモリdictに即時保存
+        # L1: インメモリdictに即時保存（デコード済みオブジェクトは無効化）
+        self._objects.pop(key, None)
         self._cache[key] = value
 
-        # L2: DBに永続化
+        # L2: 変更キーとして記録し、FLUSH_INTERVAL 後にまとめてDBへ書き込む
+        self._dirty.add(key)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """FLUSH_INTERVAL 待ってから未保存分をDBへ書き込む
+
+        書き込み中に set() されたキーや、書き込みに失敗したキーが残っていれば
+        続けて再度書き込む（失敗時は MAX_FLUSH_BACKOFF まで間隔を倍にしていく）。
+        このタスクが動いている間、set() は新しいタスクを作らない。
+        """
+        delay = self.FLUSH_INTERVAL
+        while True:
+            await asyncio.sleep(delay)
+            succeeded = await self.flush()
+            if not self._dirty:
+                return
+            delay = self.FLUSH_INTERVAL if succeeded else min(delay * 2, self.MAX_FLUSH_BACKOFF)
+
+    async def flush(self) -> bool:
+        """DB未反映のキーを1トランザクションでDBへ書き込む（UPSERT）
+
+        Returns:
+            書き込みに成功した（または書き込むものがなかった）場合True
+        """
+        if not self._dirty:
+            return True
+        keys, self._dirty = self._dirty, set()
+
         try:
             from ..database import async_session
             from ..db_models import TranslationCacheRow
@@ -85,16 +140,159 @@ class TranslationCache:
             async with async_session() as session:
                 # UPSERT: 既存キーなら更新、なければ挿入
                 existing = await session.execute(
-                    select(TranslationCacheRow).where(TranslationCacheRow.cache_key == key)
+                    select(TranslationCacheRow).where(TranslationCacheRow.cache_key.in_(keys))
                 )
-                row = existing.scalar_one_or_none()
-                if row:
-                    row.value = value
-                else:
-                    session.add(TranslationCacheRow(cache_key=key, value=value))
+                rows = {row.cache_key: row for row in existing.scalars()}
+                for key in keys:
+                    value = self._cache[key]
+                    row = rows.get(key)
+                    if row:
+                        row.value = value
+                    else:
+                        session.add(TranslationCacheRow(cache_key=key, value=value))
                 await session.commit()
+        except asyncio.CancelledError:
+            # 書き込み中に close() 等で取り消された場合も未保存分として残す
+            self._dirty |= keys
+            raise
         except Exception as e:
+            # 次回の書き込みで再試行する
+            self._dirty |= keys
             logger.warning("DB書き込み失敗（インメモリには保存済み）: %s", e)
+            return False
+        return True
+
+    async def close(self) -> None:
+        """遅延書き込みを待たずに未保存分をDBへ書き出す（終了時に呼び出す）"""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            # 書き込み中だった場合は、取り消された分が未保存として戻るのを待つ
+            await asyncio.wait([task])
+        await self.flush()
+
+    def get_json(self, key: str) -> Optional[dict]:
+        """
+        JSON値をデコード済みの dict として取得（同期 — インメモリを参照）
+
+        初回のみJSONデコードし、以降はデコード済みオブジェクトを再利用する。
+        呼び出し側での書き換えがキャッシュに波及しないよう浅いコピーを返す。
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュされた dict、存在しない・JSONとして不正な場合はNone
+        """
+        value = self._objects.get(key)
+        if value is None:
+            raw = self._cache.get(key)
+            if not raw:
+                return None
+            try:
+                value = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                return None
+            if not isinstance(value, dict):
+                return None
+            self._objects[key] = value
+        return dict(value)
+
+    async def set_json(self, key: str, value: dict) -> None:
+        """
+        dict をJSON値として保存（インメモリ + DB）
+
+        Args:
+            key: キャッシュキー
+            value: 保存する dict
+        """
+        # orjson は常にUTF-8で出力する（ensure_ascii=False 相当）
+        await self.set(key, orjson.dumps(value).decode())
+        self._objects[key] = dict(value)
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[str]]]
+    ) -> Optional[str]:
+        """
+        キャッシュにあれば返し、なければ loader の結果を保存して返す
+
+        同じキーへの同時ミスは1回の loader 呼び出しにまとめる。
+        loader が空の値を返した場合はキャッシュしない。例外はそのまま送出する。
+
+        Args:
+            key: キャッシュキー
+            loader: ミス時に値を取得するコルーチン関数
+
+        Returns:
+            キャッシュまたは loader の値
+        """
+        cached = self._cache.get(key)
+        if cached:
+            return cached
+        return await self._load_once(key, loader, self.set, self._cache.get)
+
+    async def get_or_load_json(
+        self, key: str, loader: Callable[[], Awaitable[Optional[dict]]]
+    ) -> Optional[dict]:
+        """
+        get_or_load の JSON 値版（キャッシュ・loader の dict を浅いコピーで返す）
+
+        Args:
+            key: キャッシュキー
+            loader: ミス時に dict を取得するコルーチン関数
+
+        Returns:
+            キャッシュまたは loader の dict
+        """
+        cached = self.get_json(key)
+        if cached is not None:
+            return cached
+        value = await self._load_once(key, loader, self.set_json, self.get_json)
+        return dict(value) if value else value
+
+    async def _load_once(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        store: Callable[[str, Any], Awaitable[None]],
+        lookup: Callable[[str], Any],
+    ) -> Any:
+        """同じキーの取得中 Future があれば待ち、なければ loader を呼んで保存する
+
+        先に取得していたタスクが取り消された場合、待っていた側は CancelledError を受けず
+        自分で取得し直す（CancelledError を受けるのは自分が取り消されたタスクだけ）。
+        """
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            # 先行タスクの取り消し: 最初に再開した待機者が取得を引き継ぐ。
+            # 残りの待機者は、引き継いだ取得の結果がもう保存されていればそれを使う
+            cached = lookup(key)
+            if cached:
+                return cached
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            if value:
+                await store(key, value)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 待機者がいない場合に "exception was never retrieved" を出さない
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
 
     def contains(self, key: str) -> bool:
         """
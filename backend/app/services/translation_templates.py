@@ -1,11 +1,19 @@
 """
 多言語翻訳テンプレート・静的データ定義
 
-定数のみを含むモジュール。ロジックなし。
+定数のみを含むモジュール。ロジックなし（読み取り専用化の `_freeze` を除く）。
 """
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+def _freeze(table: dict[str, dict[str, str]]) -> Mapping[str, Mapping[str, str]]:
+    """2階層の翻訳表を読み取り専用ビューにする（共有定数を呼び出し側が書き換えないように）"""
+    return MappingProxyType({key: MappingProxyType(value) for key, value in table.items()})
+
 
 # 定型文の多言語テンプレート（15言語対応）
-TEMPLATES: dict[str, dict[str, str]] = {
+TEMPLATES: Mapping[str, Mapping[str, str]] = _freeze({
     "earthquake": {
         "ja": "【地震情報】{location}で地震がありました。マグニチュード{magnitude}、最大震度{intensity}。",
         "en": "[Earthquake] An earthquake occurred in {location}. Magnitude {magnitude}, Maximum intensity {intensity}.",
@@ -96,7 +104,48 @@ TEMPLATES: dict[str, dict[str, str]] = {
         "ne": "नजिकको आश्रय: {shelter_name} ({distance} किमी)",
         "easy_ja": "ちかくの ひなんじょ: {shelter_name}（{distance}キロメートル）",
     },
-}
+})
+
+# 地震情報メッセージのテンプレート（15言語対応）
+# generate_earthquake_message が呼ばれるたびに辞書を組み立て直さないよう、
+# モジュール読み込み時に1度だけ構築して読み取り専用ビューで公開する
+EARTHQUAKE_MESSAGE_TEMPLATES: Mapping[str, str] = MappingProxyType({
+    "en": "[Earthquake] An earthquake occurred in {location}. Magnitude {magnitude}, Maximum intensity {intensity}. Depth: {depth}km. {tsunami_info}",
+    "zh": "【地震信息】{location}发生地震。震级{magnitude}，最大震度{intensity}。震源深度约{depth}公里。{tsunami_info}",
+    "zh-TW": "【地震資訊】{location}發生地震。規模{magnitude}，最大震度{intensity}。震源深度約{depth}公里。{tsunami_info}",
+    "ko": "【지진정보】{location}에서 지진이 발생했습니다. 규모 {magnitude}, 최대진도 {intensity}. 진원 깊이 약 {depth}km. {tsunami_info}",
+    "vi": "[Động đất] Động đất xảy ra tại {location}. Cường độ {magnitude}, Cường độ tối đa {intensity}. Độ sâu: {depth}km. {tsunami_info}",
+    "th": "[แผ่นดินไหว] เกิดแผ่นดินไหวที่ {location} ขนาด {magnitude} ความรุนแรงสูงสุด {intensity} ความลึก: {depth} กม. {tsunami_info}",
+    "id": "[Gempa] Gempa bumi terjadi di {location}. Magnitudo {magnitude}, Intensitas maksimum {intensity}. Kedalaman: {depth}km. {tsunami_info}",
+    "ms": "[Gempa Bumi] Gempa bumi berlaku di {location}. Magnitud {magnitude}, Keamatan maksimum {intensity}. Kedalaman: {depth}km. {tsunami_info}",
+    "tl": "[Lindol] Nagkaroon ng lindol sa {location}. Magnitude {magnitude}, Pinakamataas na intensity {intensity}. Lalim: {depth}km. {tsunami_info}",
+    "fr": "[Séisme] Un séisme s'est produit à {location}. Magnitude {magnitude}, Intensité maximale {intensity}. Profondeur: {depth}km. {tsunami_info}",
+    "de": "[Erdbeben] Ein Erdbeben ereignete sich in {location}. Magnitude {magnitude}, Maximale Intensität {intensity}. Tiefe: {depth}km. {tsunami_info}",
+    "it": "[Terremoto] Si è verificato un terremoto a {location}. Magnitudo {magnitude}, Intensità massima {intensity}. Profondità: {depth}km. {tsunami_info}",
+    "es": "[Terremoto] Ocurrió un terremoto en {location}. Magnitud {magnitude}, Intensidad máxima {intensity}. Profundidad: {depth}km. {tsunami_info}",
+    "ne": "[भूकम्प] {location} मा भूकम्प आयो। म्याग्निच्युड {magnitude}, अधिकतम तीव्रता {intensity}। गहिराई: {depth} किमी। {tsunami_info}",
+    "easy_ja": "【じしん】{location}で じしんが ありました。つよさは {intensity} です。ふかさは {depth}キロメートル。{tsunami_info}",
+})
+
+# 地震情報メッセージに添える津波の一文（15言語対応）
+# safe: 津波の心配なし / warning: 津波情報あり（{warning} に翻訳済みの津波情報が入る）
+EARTHQUAKE_TSUNAMI_TEMPLATES: Mapping[str, Mapping[str, str]] = _freeze({
+    "en": {"safe": "There is no tsunami risk from this earthquake.", "warning": "Tsunami information: {warning}."},
+    "zh": {"safe": "此次地震没有海啸风险。", "warning": "海啸信息：{warning}。"},
+    "zh-TW": {"safe": "此次地震沒有海嘯風險。", "warning": "海嘯資訊：{warning}。"},
+    "ko": {"safe": "이 지진으로 인한 쓰나미 위험은 없습니다.", "warning": "쓰나미 정보: {warning}."},
+    "vi": {"safe": "Không có nguy cơ sóng thần từ trận động đất này.", "warning": "Thông tin sóng thần: {warning}."},
+    "th": {"safe": "ไม่มีความเสี่ยงจากสึนามิจากแผ่นดินไหวครั้งนี้", "warning": "ข้อมูลสึนามิ: {warning}"},
+    "id": {"safe": "Tidak ada risiko tsunami dari gempa ini.", "warning": "Informasi tsunami: {warning}."},
+    "ms": {"safe": "Tiada risiko tsunami daripada gempa bumi ini.", "warning": "Maklumat tsunami: {warning}."},
+    "tl": {"safe": "Walang panganib ng tsunami mula sa lindol na ito.", "warning": "Impormasyon tungkol sa tsunami: {warning}."},
+    "fr": {"safe": "Il n'y a pas de risque de tsunami suite à ce séisme.", "warning": "Information tsunami: {warning}."},
+    "de": {"safe": "Es besteht keine Tsunami-Gefahr durch dieses Erdbeben.", "warning": "Tsunami-Information: {warning}."},
+    "it": {"safe": "Non c'è rischio di tsunami da questo terremoto.", "warning": "Informazioni tsunami: {warning}."},
+    "es": {"safe": "No hay riesgo de tsunami por este terremoto.", "warning": "Información de tsunami: {warning}."},
+    "ne": {"safe": "यस भूकम्पबाट सुनामीको जोखिम छैन।", "warning": "सुनामी जानकारी: {warning}।"},
+    "easy_ja": {"safe": "この じしんで つなみの しんぱいは ありません。", "warning": "つなみ じょうほう: {warning}。"},
+})
 
 # 言語名マッピング（表示用、15言語 + easy_ja）
 LANGUAGE_NAMES: dict[str, str] = {
@@ -138,7 +187,7 @@ LANG_NAMES: dict[str, str] = {
 }
 
 # 津波情報の翻訳（15言語対応）
-TSUNAMI_TRANSLATIONS: dict[str, dict[str, str]] = {
+TSUNAMI_TRANSLATIONS: Mapping[str, Mapping[str, str]] = _freeze({
     "なし": {
         "en": "None", "zh": "无", "zh-TW": "無", "ko": "없음",
         "vi": "Không có", "th": "ไม่มี", "id": "Tidak ada", "ms": "Tiada",
@@ -181,10 +230,10 @@ TSUNAMI_TRANSLATIONS: dict[str, dict[str, str]] = {
         "fr": "Alerte tsunami", "de": "Tsunami-Warnung", "it": "Allerta tsunami",
         "es": "Alerta de tsunami", "ne": "सुनामी चेतावनी", "easy_ja": "つなみ けいほう",
     },
-}
+})
 
 # 震度翻訳（JMA震度階級、10震度 x 16言語）
-INTENSITY_TRANSLATIONS: dict[str, dict[str, str]] = {
+INTENSITY_TRANSLATIONS: Mapping[str, Mapping[str, str]] = _freeze({
     "0": {
         "ja": "震度0", "en": "0", "zh": "0", "zh-TW": "0", "ko": "0",
         "vi": "0", "th": "0", "id": "0", "ms": "0", "tl": "0",
@@ -245,7 +294,7 @@ INTENSITY_TRANSLATIONS: dict[str, dict[str, str]] = {
         "fr": "7", "de": "7", "it": "7", "es": "7", "ne": "7",
         "easy_ja": "しんど 7",
     },
-}
+})
 
 # 災害種別の多言語マッピング
 DISASTER_TYPES: dict[str, dict[str, str]] = {
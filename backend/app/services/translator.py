@@ -9,7 +9,10 @@
 リファクタリング後: コア翻訳ロジックのみ保持。
 AI API呼び出し、キャッシュ、安全ガイド、テンプレートは各専門モジュールに委譲。
 """
-import json
+import asyncio
+import string
+import time
+from collections import OrderedDict
 from typing import Optional
 
 import httpx
@@ -19,6 +22,8 @@ from .safety_guide import SafetyGuideGenerator
 from .translation_cache import TranslationCache
 from .translation_templates import (
     DISASTER_TYPES,
+    EARTHQUAKE_MESSAGE_TEMPLATES,
+    EARTHQUAKE_TSUNAMI_TEMPLATES,
     INTENSITY_TRANSLATIONS,
     LANG_NAMES,
     LANGUAGE_NAMES,
@@ -30,10 +35,109 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_Segments = tuple[tuple[str, Optional[str]], ...]
+
+
+def _parse_segments(template: str) -> _Segments:
+    """テンプレート文字列を (リテラル, フィールド名) の列に事前分解する
+
+    書式指定・変換指定は使用していないため、フィールド名のみを保持する。
+    """
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _spec, _conversion in string.Formatter().parse(template)
+    )
+
+
+def _render(segments: _Segments, values: dict) -> str:
+    """事前分解済みのテンプレートに値を埋め込む（書式文字列の再解析なし）"""
+    return "".join(
+        literal if field_name is None else literal + str(values[field_name])
+        for literal, field_name in segments
+    )
+
+
+# 言語ごとの地震メッセージ・津波情報テンプレート（起動時に一度だけ分解しておく）
+_EARTHQUAKE_MESSAGE_SEGMENTS: dict[str, _Segments] = {
+    lang: _parse_segments(template) for lang, template in EARTHQUAKE_MESSAGE_TEMPLATES.items()
+}
+_TSUNAMI_WARNING_SEGMENTS: dict[str, _Segments] = {
+    lang: _parse_segments(templates["warning"])
+    for lang, templates in EARTHQUAKE_TSUNAMI_TEMPLATES.items()
+}
+
+
+# 災害種別名の (種別, 言語) -> 名称 の平坦な索引（2段の dict.get を1回の参照にする）
+_DISASTER_TYPE_NAMES: dict[tuple[str, str], str] = {
+    (disaster_type, lang): name
+    for disaster_type, names in DISASTER_TYPES.items()
+    for lang, name in names.items()
+}
+
+
+def _build_exact_templates() -> dict[str, dict[str, str]]:
+    """日本語の定型文 -> 言語別翻訳 の索引を作る（完全一致し得るテンプレートのみ）
+
+    プレースホルダーを含むテンプレートは完全一致し得ないため除外する。
+    同じ定型文が複数ある場合は TEMPLATES で先に定義されたものを使う。
+    """
+    index: dict[str, dict[str, str]] = {}
+    for translations in TEMPLATES.values():
+        ja_template = translations.get("ja", "")
+        if ja_template and "{" not in ja_template:
+            index.setdefault(ja_template, translations)
+    return index
+
+
+_EXACT_TEMPLATES = _build_exact_templates()
+
+# 警報生成用の共通指示（system。全言語・全警報で同一のためプロンプトキャッシュの対象）
+_WARNING_SYSTEM_PROMPT = """You generate disaster warning information for people in Japan, in the language the user requests.
+
+Return ONLY a JSON object with these exact keys (no markdown, no explanation):
+{
+  "name": "translated warning name",
+  "description": "brief explanation of this warning type for the given area (1 sentence)",
+  "action": "recommended immediate action for people in affected area (1-2 sentences)"
+}
+
+Important:
+- Keep translations accurate and culturally appropriate
+- For "easy_ja", use simple hiragana and basic vocabulary
+- Action should be practical and specific to this warning type"""
+
+# 警報生成用プロンプト（可変部分のみ format で埋める）
+_WARNING_PROMPT_TEMPLATE = """Translate and generate disaster warning information in {target_name}.
+
+Japanese warning name: {warning_name_ja}
+Severity level: {severity_desc}
+Area: {area_name}"""
+
+# 日本語の重要度別デフォルト推奨行動
+_DEFAULT_ACTIONS_JA = {
+    "low": "最新の情報に注意してください。",
+    "medium": "今後の情報に注意し、必要に応じて安全な場所へ移動してください。",
+    "high": "屋外での活動を控え、安全な場所で待機してください。",
+    "extreme": "直ちに安全な場所へ避難してください。命を守る行動を取ってください。",
+}
+
 
 class TranslatorService:
     """ハイブリッド翻訳サービス（ファサード）"""
 
+    # AI 翻訳に失敗した地名を再試行しない期間（秒）
+    NEGATIVE_CACHE_TTL = 60.0
+    # ネガティブキャッシュに保持する件数の上限（超えたら古いものから捨てる）
+    NEGATIVE_CACHE_MAX = 1024
+
+    # 警報プロンプトに埋める重要度の説明
+    _SEVERITY_CONTEXT_WARNING = {
+        "low": "minor advisory",
+        "medium": "advisory requiring attention",
+        "high": "serious warning requiring caution",
+        "extreme": "emergency warning requiring immediate action",
+    }
+
     def __init__(self):
         """初期化"""
         from ..config import settings
@@ -51,11 +155,16 @@ class TranslatorService:
             anthropic_api_version=settings.anthropic_api_version,
             translate_timeout=httpx.Timeout(settings.ai_timeout_translate, connect=5.0),
             generate_timeout=httpx.Timeout(settings.ai_timeout_generate, connect=5.0),
+            max_concurrency=settings.ai_max_concurrency,
         )
 
         # 安全ガイド生成
         self._safety_guide = SafetyGuideGenerator(self._ai, self._cache)
 
+        # AI 翻訳の失敗を覚えておくネガティブキャッシュ: (地名, 言語) -> 再試行可能になる時刻
+        # レート制限や障害の最中に同じ地名で API を叩き続けないようにする
+        self._neg_cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+
         self.timeout = settings.api_timeout
 
     async def cache_init(self) -> None:
@@ -80,6 +189,11 @@ class TranslatorService:
         if target_lang == "ja":
             return location
 
+        # 英語指定で ASCII のみの地名（例: "Tokyo Bay"）は既に英語表記なのでそのまま返す。
+        # 静的マッピングのキーは日本語のみのため、以降の検索はすべて空振りになる
+        if target_lang == "en" and location.isascii():
+            return location
+
         # 1. 静的マッピングを試行
         static_translation = get_location_translation(location, target_lang)
         if static_translation:
@@ -91,20 +205,46 @@ class TranslatorService:
         if cached:
             return cached
 
-        # 3. AI APIで翻訳
+        # 3. AI APIで翻訳（直近に失敗した地名は TTL が切れるまで再試行しない）
         provider = self._ai.get_active_provider()
-        if provider:
+        neg_key = (location, target_lang)
+        if provider and not self._is_negative_cached(neg_key):
             try:
-                translated = await self._ai.translate_text(location, target_lang)
+                translated = await self._cache.get_or_load(
+                    cache_key, lambda: self._ai.translate_text(location, target_lang)
+                )
                 if translated:
-                    await self._cache.set(cache_key, translated)
                     return translated
             except Exception as e:
                 logger.error(f"AI API翻訳エラー ({provider}): {e}", exc_info=True)
+            self._mark_negative(neg_key)
 
         # 4. フォールバック: 元のテキストを返す
         return location
 
+    def _mark_negative(self, key: tuple[str, str]) -> None:
+        """AI 翻訳の失敗を記録し、期限切れと上限超過のエントリを古い順に捨てる
+
+        TTL は一定なので挿入順がそのまま期限順になり、先頭から見れば足りる。
+        """
+        now = time.monotonic()
+        self._neg_cache.pop(key, None)
+        self._neg_cache[key] = now + self.NEGATIVE_CACHE_TTL
+        while self._neg_cache and (
+            len(self._neg_cache) > self.NEGATIVE_CACHE_MAX or next(iter(self._neg_cache.values())) <= now
+        ):
+            self._neg_cache.popitem(last=False)
+
+    def _is_negative_cached(self, key: tuple[str, str]) -> bool:
+        """AI 翻訳の失敗が記録されていて、まだ TTL 内か判定（期限切れは掃除する）"""
+        expires_at = self._neg_cache.get(key)
+        if expires_at is None:
+            return False
+        if expires_at > time.monotonic():
+            return True
+        del self._neg_cache[key]
+        return False
+
     # ------------------------------------------------------------------
     # 津波・震度翻訳（静的マッピング）
     # ------------------------------------------------------------------
@@ -183,9 +323,10 @@ class TranslatorService:
         provider = self._ai.get_active_provider()
         if provider:
             try:
-                translated = await self._ai.translate_text(text, target_lang)
+                translated = await self._cache.get_or_load(
+                    cache_key, lambda: self._ai.translate_text(text, target_lang)
+                )
                 if translated:
-                    await self._cache.set(cache_key, translated)
                     return translated
             except Exception as e:
                 logger.error(f"翻訳エラー ({provider}): {e}", exc_info=True)
@@ -209,15 +350,10 @@ class TranslatorService:
         Returns:
             翻訳されたテキスト（テンプレートが見つからない場合はNone）
         """
-        for _template_key, translations in TEMPLATES.items():
-            ja_template = translations.get("ja", "")
-            # プレースホルダーを含むテンプレートは完全一致し得ないためスキップ
-            if not ja_template or "{" in ja_template:
-                continue
-            if text == ja_template:
-                return translations.get(target_lang)
-
-        return None
+        translations = _EXACT_TEMPLATES.get(text)
+        if translations is None:
+            return None
+        return translations.get(target_lang)
 
     # ------------------------------------------------------------------
     # テンプレート
@@ -280,59 +416,26 @@ class TranslatorService:
         Returns:
             翻訳されたメッセージ
         """
-        # 各言語のテンプレート（15言語対応）
-        templates = {
-            "en": "[Earthquake] An earthquake occurred in {location}. Magnitude {magnitude}, Maximum intensity {intensity}. Depth: {depth}km. {tsunami_info}",
-            "zh": "【地震信息】{location}发生地震。震级{magnitude}，最大震度{intensity}。震源深度约{depth}公里。{tsunami_info}",
-            "zh-TW": "【地震資訊】{location}發生地震。規模{magnitude}，最大震度{intensity}。震源深度約{depth}公里。{tsunami_info}",
-            "ko": "【지진정보】{location}에서 지진이 발생했습니다. 규모 {magnitude}, 최대진도 {intensity}. 진원 깊이 약 {depth}km. {tsunami_info}",
-            "vi": "[Động đất] Động đất xảy ra tại {location}. Cường độ {magnitude}, Cường độ tối đa {intensity}. Độ sâu: {depth}km. {tsunami_info}",
-            "th": "[แผ่นดินไหว] เกิดแผ่นดินไหวที่ {location} ขนาด {magnitude} ความรุนแรงสูงสุด {intensity} ความลึก: {depth} กม. {tsunami_info}",
-            "id": "[Gempa] Gempa bumi terjadi di {location}. Magnitudo {magnitude}, Intensitas maksimum {intensity}. Kedalaman: {depth}km. {tsunami_info}",
-            "ms": "[Gempa Bumi] Gempa bumi berlaku di {location}. Magnitud {magnitude}, Keamatan maksimum {intensity}. Kedalaman: {depth}km. {tsunami_info}",
-            "tl": "[Lindol] Nagkaroon ng lindol sa {location}. Magnitude {magnitude}, Pinakamataas na intensity {intensity}. Lalim: {depth}km. {tsunami_info}",
-            "fr": "[Séisme] Un séisme s'est produit à {location}. Magnitude {magnitude}, Intensité maximale {intensity}. Profondeur: {depth}km. {tsunami_info}",
-            "de": "[Erdbeben] Ein Erdbeben ereignete sich in {location}. Magnitude {magnitude}, Maximale Intensität {intensity}. Tiefe: {depth}km. {tsunami_info}",
-            "it": "[Terremoto] Si è verificato un terremoto a {location}. Magnitudo {magnitude}, Intensità massima {intensity}. Profondità: {depth}km. {tsunami_info}",
-            "es": "[Terremoto] Ocurrió un terremoto en {location}. Magnitud {magnitude}, Intensidad máxima {intensity}. Profundidad: {depth}km. {tsunami_info}",
-            "ne": "[भूकम्प] {location} मा भूकम्प आयो। म्याग्निच्युड {magnitude}, अधिकतम तीव्रता {intensity}। गहिराई: {depth} किमी। {tsunami_info}",
-            "easy_ja": "【じしん】{location}で じしんが ありました。つよさは {intensity} です。ふかさは {depth}キロメートル。{tsunami_info}",
-        }
-
-        # 津波情報のテンプレート（15言語対応）
-        tsunami_templates = {
-            "en": {"safe": "There is no tsunami risk from this earthquake.", "warning": "Tsunami information: {warning}."},
-            "zh": {"safe": "此次地震没有海啸风险。", "warning": "海啸信息：{warning}。"},
-            "zh-TW": {"safe": "此次地震沒有海嘯風險。", "warning": "海嘯資訊：{warning}。"},
-            "ko": {"safe": "이 지진으로 인한 쓰나미 위험은 없습니다.", "warning": "쓰나미 정보: {warning}."},
-            "vi": {"safe": "Không có nguy cơ sóng thần từ trận động đất này.", "warning": "Thông tin sóng thần: {warning}."},
-            "th": {"safe": "ไม่มีความเสี่ยงจากสึนามิจากแผ่นดินไหวครั้งนี้", "warning": "ข้อมูลสึนามิ: {warning}"},
-            "id": {"safe": "Tidak ada risiko tsunami dari gempa ini.", "warning": "Informasi tsunami: {warning}."},
-            "ms": {"safe": "Tiada risiko tsunami daripada gempa bumi ini.", "warning": "Maklumat tsunami: {warning}."},
-            "tl": {"safe": "Walang panganib ng tsunami mula sa lindol na ito.", "warning": "Impormasyon tungkol sa tsunami: {warning}."},
-            "fr": {"safe": "Il n'y a pas de risque de tsunami suite à ce séisme.", "warning": "Information tsunami: {warning}."},
-            "de": {"safe": "Es besteht keine Tsunami-Gefahr durch dieses Erdbeben.", "warning": "Tsunami-Information: {warning}."},
-            "it": {"safe": "Non c'è rischio di tsunami da questo terremoto.", "warning": "Informazioni tsunami: {warning}."},
-            "es": {"safe": "No hay riesgo de tsunami por este terremoto.", "warning": "Información de tsunami: {warning}."},
-            "ne": {"safe": "यस भूकम्पबाट सुनामीको जोखिम छैन।", "warning": "सुनामी जानकारी: {warning}।"},
-            "easy_ja": {"safe": "この じしんで つなみの しんぱいは ありません。", "warning": "つなみ じょうほう: {warning}。"},
-        }
-
-        template = templates.get(lang, templates["en"])
-        tsunami_template = tsunami_templates.get(lang, tsunami_templates["en"])
+        if lang not in _EARTHQUAKE_MESSAGE_SEGMENTS:
+            lang = "en"
 
         # 津波情報の生成
         if tsunami_warning in ["なし", "None"]:
-            tsunami_info = tsunami_template["safe"]
+            tsunami_info = EARTHQUAKE_TSUNAMI_TEMPLATES[lang]["safe"]
         else:
-            tsunami_info = tsunami_template["warning"].format(warning=tsunami_warning_translated)
-
-        return template.format(
-            location=location,
-            magnitude=magnitude,
-            intensity=intensity,
-            depth=depth,
-            tsunami_info=tsunami_info,
+            tsunami_info = _render(
+                _TSUNAMI_WARNING_SEGMENTS[lang], {"warning": tsunami_warning_translated}
+            )
+
+        return _render(
+            _EARTHQUAKE_MESSAGE_SEGMENTS[lang],
+            {
+                "location": location,
+                "magnitude": magnitude,
+                "intensity": intensity,
+                "depth": depth,
+                "tsunami_info": tsunami_info,
+            },
         )
 
     # ------------------------------------------------------------------
@@ -371,26 +474,29 @@ class TranslatorService:
 
         # キャッシュを確認
         cache_key = self._cache.make_key(f"warning:{warning_name_ja}:{area_name}:{severity}", target_lang)
-        cached = self._cache.get(cache_key)
-        if cached:
-            try:
-                return json.loads(cached)
-            except json.JSONDecodeError:
-                pass
+        cached = self._cache.get_json(cache_key)
+        if cached is not None:
+            return cached
 
         # AI APIで生成
         provider = self._ai.get_active_provider()
         if provider:
-            try:
+            async def load() -> Optional[dict]:
                 prompt = self._build_warning_prompt(warning_name_ja, target_lang, area_name, severity)
-                result = await self._ai.generate_json(prompt, max_tokens=500)
-                if result:
-                    warning_result = {
-                        "name": result.get("name", warning_name_ja),
-                        "description": result.get("description", ""),
-                        "action": result.get("action", ""),
-                    }
-                    await self._cache.set(cache_key, json.dumps(warning_result, ensure_ascii=False))
+                result = await self._ai.generate_json(
+                    prompt, max_tokens=500, system=_WARNING_SYSTEM_PROMPT
+                )
+                if not result:
+                    return None
+                return {
+                    "name": result.get("name", warning_name_ja),
+                    "description": result.get("description", ""),
+                    "action": result.get("action", ""),
+                }
+
+            try:
+                warning_result = await self._cache.get_or_load_json(cache_key, load)
+                if warning_result:
                     return warning_result
             except Exception as e:
                 logger.error(f"警報テキスト生成エラー ({provider}): {e}", exc_info=True)
@@ -403,6 +509,34 @@ class TranslatorService:
             "action": "",
         }
 
+    async def generate_warning_text_multi(
+        self,
+        warning_name_ja: str,
+        langs: list[str],
+        area_name: Optional[str] = None,
+        severity: str = "medium",
+    ) -> dict[str, dict[str, str]]:
+        """
+        警報テキストを複数言語ぶん並列に生成
+
+        言語ごとの AI 呼び出しを asyncio.gather で同時に走らせるため、
+        N 言語の生成にかかる時間は N 往復ではなくほぼ 1 往復になる。
+
+        Args:
+            warning_name_ja: 日本語の警報名
+            langs: 翻訳先言語コードのリスト
+            area_name: 地域名（オプション）
+            severity: 重要度
+
+        Returns:
+            {言語コード: generate_warning_text の結果}（生成に失敗した言語は含まない）
+        """
+        results = await asyncio.gather(
+            *(self.generate_warning_text(warning_name_ja, lang, area_name, severity) for lang in langs),
+            return_exceptions=True,
+        )
+        return self._collect_multi(langs, results, "警報テキスト")
+
     def _build_warning_prompt(
         self,
         warning_name_ja: str,
@@ -411,45 +545,17 @@ class TranslatorService:
         severity: str,
     ) -> str:
         """警報生成用のプロンプトを構築"""
-        target_name = LANG_NAMES.get(target_lang, target_lang)
-
-        severity_context = {
-            "low": "minor advisory",
-            "medium": "advisory requiring attention",
-            "high": "serious warning requiring caution",
-            "extreme": "emergency warning requiring immediate action",
-        }
-        severity_desc = severity_context.get(severity, "advisory")
-        area_context = f" for {area_name}" if area_name else ""
-
-        return f"""Translate and generate disaster warning information in {target_name}.
-
-Japanese warning name: {warning_name_ja}
-Severity level: {severity_desc}
-Area: {area_name or "general"}
-
-Return ONLY a JSON object with these exact keys (no markdown, no explanation):
-{{
-  "name": "translated warning name",
-  "description": "brief explanation of this warning type{area_context} (1 sentence)",
-  "action": "recommended immediate action for people in affected area (1-2 sentences)"
-}}
-
-Important:
-- Keep translations accurate and culturally appropriate
-- For "easy_ja", use simple hiragana and basic vocabulary
-- Action should be practical and specific to this warning type"""
+        return _WARNING_PROMPT_TEMPLATE.format(
+            target_name=LANG_NAMES.get(target_lang, target_lang),
+            warning_name_ja=warning_name_ja,
+            severity_desc=self._SEVERITY_CONTEXT_WARNING.get(severity, "advisory"),
+            area_name=area_name or "general",
+        )
 
     @staticmethod
     def _get_default_action_ja(severity: str) -> str:
         """日本語のデフォルト推奨行動を取得"""
-        actions = {
-            "low": "最新の情報に注意してください。",
-            "medium": "今後の情報に注意し、必要に応じて安全な場所へ移動してください。",
-            "high": "屋外での活動を控え、安全な場所で待機してください。",
-            "extreme": "直ちに安全な場所へ避難してください。命を守る行動を取ってください。",
-        }
-        return actions.get(severity, actions["medium"])
+        return _DEFAULT_ACTIONS_JA.get(severity, _DEFAULT_ACTIONS_JA["medium"])
 
     # ------------------------------------------------------------------
     # 安全ガイド（SafetyGuideGenerator へ委譲）
@@ -476,6 +582,43 @@ Important:
         """
         return await self._safety_guide.generate(disaster_type, target_lang, location, severity)
 
+    async def generate_safety_guide_multi(
+        self,
+        disaster_type: str,
+        langs: list[str],
+        location: Optional[str] = None,
+        severity: str = "medium",
+    ) -> dict[str, dict]:
+        """
+        安全ガイドを複数言語ぶん並列に生成
+
+        Args:
+            disaster_type: 災害種別
+            langs: 言語コードのリスト
+            location: 地域名（オプション）
+            severity: 重要度
+
+        Returns:
+            {言語コード: 安全ガイド情報}（生成に失敗した言語は含まない）
+        """
+        results = await asyncio.gather(
+            *(self.generate_safety_guide(disaster_type, lang, location, severity) for lang in langs),
+            return_exceptions=True,
+        )
+        return self._collect_multi(langs, results, "安全ガイド")
+
+    @staticmethod
+    def _collect_multi(langs: list[str], results: list, label: str) -> dict:
+        """gather(return_exceptions=True) の結果を言語別の辞書にまとめる（失敗はログして除外）"""
+        collected = {}
+        for lang, result in zip(langs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{label}の並列生成エラー ({lang}): {result}", exc_info=result)
+                continue
+            if result is not None:
+                collected[lang] = result
+        return collected
+
     # ------------------------------------------------------------------
     # ユーティリティ
     # ------------------------------------------------------------------
@@ -490,23 +633,24 @@ Important:
 
     def get_disaster_type_name(self, disaster_type: str, lang: str) -> str:
         """災害種別の翻訳名を取得"""
-        return DISASTER_TYPES.get(disaster_type, {}).get(lang, disaster_type)
+        return _DISASTER_TYPE_NAMES.get((disaster_type, lang), disaster_type)
 
     # ------------------------------------------------------------------
     # リソース管理
     # ------------------------------------------------------------------
 
     async def close(self) -> None:
-        """保持しているリソースを解放する（HTTPクライアント等）"""
+        """保持しているリソースを解放する（HTTPクライアント・未保存のキャッシュ等）"""
         await self._ai.close()
+        await self._cache.close()
 
     # ------------------------------------------------------------------
     # 後方互換: テスト等で使われる内部メソッドへのアクセス
     # ------------------------------------------------------------------
 
-    def _get_cache_key(self, text: str, target_lang: str) -> str:
-        """キャッシュキーを生成（後方互換）"""
-        return self._cache.make_key(text, target_lang)
+    # キャッシュキーを生成（後方互換）。TranslationCache.make_key そのもの（lru_cache でメモ化済み）を
+    # 静的メソッドとして公開し、インスタンス経由の委譲を挟まない
+    _get_cache_key = staticmethod(TranslationCache.make_key)
 
     async def _translate_with_ai(self, text: str, target_lang: str) -> Optional[str]:
         """AI APIで翻訳（後方互換）"""
@@ -1,7 +1,12 @@
 """
 気象庁 津波情報サービス
 """
+import asyncio
+import re
+import time
+
 import httpx
+import orjson
 from typing import Optional
 from datetime import datetime
 from ..models import TsunamiInfo
@@ -9,6 +14,27 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 警報・注意報の種別名（大津波警報を津波警報より先に置き、最長一致させる）
+_WARNING_KIND_RE = re.compile("大津波警報|津波警報|津波注意報")
+
+# 警報レベルの優先順（タイトルに複数の種別が含まれる場合は上位を採用）
+_LEVEL_PRIORITY = {"major_warning": 0, "warning": 1, "advisory": 2}
+
+# 津波情報メッセージ（タイトルから判定した警報レベル別）
+_EVACUATE_TEMPLATE = "【{title}】{location}でマグニチュード{magnitude}の地震が発生しました。直ちに高台へ避難してください。"
+_TITLE_TEMPLATES = {
+    "major_warning": _EVACUATE_TEMPLATE,
+    "warning": _EVACUATE_TEMPLATE,
+    "advisory": "【{title}】{location}でマグニチュード{magnitude}の地震が発生しました。海岸から離れてください。",
+    "none": "【津波情報】{location}でマグニチュード{magnitude}の地震が発生しました。{title}",
+}
+
+# 一覧キャッシュに保持する件数（API の limit 上限に合わせる）
+_LIST_CACHE_SIZE = 100
+
+# ISO 6709 形式の座標（緯度・経度・深さ[m]、例: +40.9+143.0-20000/）
+_COORD_RE = re.compile(r"^([+-]\d+(?:\.\d+)?)([+-]\d+(?:\.\d+)?)(?:[+-]\d+)?/?$")
+
 
 class TsunamiService:
     """気象庁の津波情報を取得するサービス"""
@@ -19,9 +45,21 @@ class TsunamiService:
         self.timeout = settings.api_timeout
         self._client: Optional[httpx.AsyncClient] = None
 
+        # 一覧のキャッシュと条件付きGET用の検証子（ETag / Last-Modified）
+        self._list_cache: list[TsunamiInfo] = []
+        self._list_fetched_at: Optional[float] = None
+        self._list_etag: Optional[str] = None
+        self._list_last_modified: Optional[str] = None
+        # 同時アクセスを1回の取得にまとめる
+        self._list_lock = asyncio.Lock()
+
     def _get_client(self) -> httpx.AsyncClient:
+        """一覧・詳細の取得で共有する httpx.AsyncClient を遅延初期化して返す"""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
         return self._client
 
     async def close(self) -> None:
@@ -29,6 +67,9 @@ class TsunamiService:
             await self._client.aclose()
             self._client = None
 
+    # 一覧を再取得せずにキャッシュを返す期間（秒）
+    LIST_CACHE_TTL = 30.0
+
     # 津波警報レベルマッピング
     TSUNAMI_LEVELS = {
         "大津波警報": "major_warning",
@@ -42,23 +83,53 @@ class TsunamiService:
         """
         津波情報一覧を取得
 
+        LIST_CACHE_TTL 秒以内はキャッシュを返し、期限切れ後は ETag /
+        Last-Modified による条件付きGETで更新の有無だけを確認する。
+        更新に失敗した場合は前回取得できた一覧を返す（一度も取得できていなければ空リスト）。
+
         Args:
             limit: 取得件数
 
         Returns:
-            list[TsunamiInfo]: 津波情報リスト
+            list[TsunamiInfo]: 津波情報リスト（呼び出し側で書き換えられるようコピーを返す）
         """
+        async with self._list_lock:
+            if (
+                self._list_fetched_at is None
+                or time.monotonic() - self._list_fetched_at >= self.LIST_CACHE_TTL
+            ):
+                if not await self._refresh_list():
+                    if self._list_fetched_at is None:
+                        return []
+                    # 一時的な取得失敗で発表中の津波警報を消さないよう、前回の一覧を返す
+                    logger.warning("津波情報の更新に失敗したため前回取得した一覧を返します")
+        return [tsunami.model_copy() for tsunami in self._list_cache[:limit]]
+
+    async def _refresh_list(self) -> bool:
+        """一覧を取得してキャッシュを更新する（304 の場合はパースしない。失敗時はキャッシュを変えない）"""
         url = f"{self.BASE_URL}/tsunami/data/list.json"
+        headers = {}
+        if self._list_etag:
+            headers["If-None-Match"] = self._list_etag
+        if self._list_last_modified:
+            headers["If-Modified-Since"] = self._list_last_modified
 
         client = self._get_client()
         try:
-            response = await client.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            return self._parse_tsunami_list(data[:limit])
-        except httpx.HTTPError as e:
+            response = await client.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+                # 生バイト列を orjson で直接デコードする（httpx の文字列デコードを省く）
+                data = orjson.loads(response.content)
+                self._list_cache = self._parse_tsunami_list(data[:_LIST_CACHE_SIZE])
+                self._list_etag = response.headers.get("ETag")
+                self._list_last_modified = response.headers.get("Last-Modified")
+        except (httpx.HTTPError, ValueError, TypeError) as e:
             logger.error(f"津波情報取得エラー: {e}", exc_info=True)
-            return []
+            return False
+
+        self._list_fetched_at = time.monotonic()
+        return True
 
     def _parse_tsunami_list(self, data: list) -> list[TsunamiInfo]:
         """APIレスポンスを津波情報リストにパース"""
@@ -71,7 +142,8 @@ class TsunamiService:
                 lat, lon = self._parse_coordinates(coordinates)
 
                 # 警報レベルの判定
-                warning_level = self._determine_warning_level(item.get("kind", []))
+                kind_list = item.get("kind", [])
+                warning_level = self._determine_warning_level(kind_list)
 
                 tsunami = TsunamiInfo(
                     id=item.get("ctt", ""),
@@ -85,7 +157,7 @@ class TsunamiService:
                     magnitude=item.get("mag"),
                     coordinates=coordinates,
                     warning_level=warning_level,
-                    areas=item.get("kind", []),
+                    areas=kind_list,
                     message=self._generate_message(item)
                 )
                 tsunamis.append(tsunami)
@@ -97,52 +169,32 @@ class TsunamiService:
 
     def _parse_coordinates(self, coord_str: str) -> tuple[Optional[float], Optional[float]]:
         """座標文字列をパース（例: +40.9+143.0-20000/）"""
-        try:
-            if not coord_str:
-                return None, None
-            # 末尾のスラッシュを除去
-            coord_str = coord_str.rstrip("/")
-            # 深さ情報を除去
-            parts = coord_str.split("-")
-            if len(parts) >= 2:
-                coord_str = parts[0]
-
-            # 緯度・経度を抽出
-            lat = None
-            lon = None
-            if "+" in coord_str:
-                segments = coord_str.split("+")
-                if len(segments) >= 3:
-                    lat = float(segments[1])
-                    lon = float(segments[2])
-            return lat, lon
-        except Exception:
+        match = _COORD_RE.match(coord_str) if coord_str else None
+        if match is None:
             return None, None
+        return float(match.group(1)), float(match.group(2))
 
     def _determine_warning_level(self, kind_list: list) -> str:
         """警報レベルを判定"""
         for kind in kind_list:
-            name = kind.get("name", "")
-            if "大津波警報" in name:
-                return "major_warning"
-            elif "津波警報" in name:
-                return "warning"
-            elif "津波注意報" in name:
-                return "advisory"
+            match = _WARNING_KIND_RE.search(kind.get("name", ""))
+            if match:
+                return self.TSUNAMI_LEVELS[match.group()]
         return "none"
 
+    def _classify_title(self, title: str) -> str:
+        """タイトルに含まれる種別から警報レベルを判定（1回の走査）"""
+        levels = [self.TSUNAMI_LEVELS[kind] for kind in _WARNING_KIND_RE.findall(title)]
+        return min(levels, key=_LEVEL_PRIORITY.__getitem__) if levels else "none"
+
     def _generate_message(self, item: dict) -> str:
         """津波情報メッセージを生成"""
-        location = item.get("anm", "不明")
-        magnitude = item.get("mag", "不明")
         title = item.get("ttl", "")
-
-        if "大津波警報" in title or "津波警報" in title:
-            return f"【{title}】{location}でマグニチュード{magnitude}の地震が発生しました。直ちに高台へ避難してください。"
-        elif "津波注意報" in title:
-            return f"【{title}】{location}でマグニチュード{magnitude}の地震が発生しました。海岸から離れてください。"
-        else:
-            return f"【津波情報】{location}でマグニチュード{magnitude}の地震が発生しました。{title}"
+        return _TITLE_TEMPLATES[self._classify_title(title)].format(
+            title=title,
+            location=item.get("anm", "不明"),
+            magnitude=item.get("mag", "不明"),
+        )
 
     async def get_active_warnings(self) -> list[TsunamiInfo]:
         """
@@ -172,7 +224,7 @@ class TsunamiService:
         try:
             response = await client.get(url, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             logger.error(f"津波詳細情報取得エラー: {e}", exc_info=True)
             return None
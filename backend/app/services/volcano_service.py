@@ -5,10 +5,14 @@ import asyncio
 import httpx
 from typing import Optional
 from ..models import VolcanoInfo, VolcanoWarning
+from ..utils.http_cache import HTTP2_AVAILABLE, JsonTTLCache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 火山一覧をまだパースしていないことを表す番兵（None は 404 のキャッシュ値と区別する）
+_UNSET = object()
+
 
 class VolcanoService:
     """気象庁の火山情報を取得するサービス"""
@@ -18,10 +22,34 @@ class VolcanoService:
         self.BASE_URL = f"{settings.jma_base_url}/volcano"
         self.timeout = settings.api_timeout
         self._client: Optional[httpx.AsyncClient] = None
+        # 気象庁 JSON のキャッシュ（火山一覧は静的、警報は分単位で更新）
+        self._json_cache = JsonTTLCache()
+        # 火山警報の同時取得数の上限（同時に来たリクエスト間でも共有する）
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCH)
+        # パース済みの火山一覧とコード索引（元の JSON が入れ替わったときだけ作り直す）
+        self._volcanoes: list[VolcanoInfo] = []
+        self._volcano_index: dict[int, VolcanoInfo] = {}
+        self._volcano_source: object = _UNSET
+
+    # 火山警報を並列取得するときの同時接続数
+    MAX_CONCURRENT_FETCH = 10
+
+    # キャッシュの有効期間（秒）
+    VOLCANO_LIST_TTL = 86400.0
+    WARNING_TTL = 60.0
 
     def _get_client(self) -> httpx.AsyncClient:
+        """火山一覧・各火山の警報取得で共有する httpx.AsyncClient を遅延初期化して返す
+
+        並列取得（Semaphore(10)）の同時接続をすべてキープアライブで使い回せるよう、
+        プール上限を並列数より大きく取る。h2 が入っていれば HTTP/2 で1本の接続に多重化する。
+        """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                http2=HTTP2_AVAILABLE,
+            )
         return self._client
 
     async def close(self) -> None:
@@ -61,6 +89,8 @@ class VolcanoService:
         509,  # 新燃岳
         510,  # 硫黄島
     ]
+    # 一覧パース時の所属判定用（MONITORED_VOLCANOES は取得順を保つためリストのまま）
+    _MONITORED_SET = frozenset(MONITORED_VOLCANOES)
 
     async def get_volcano_list(self) -> list[VolcanoInfo]:
         """
@@ -69,17 +99,28 @@ class VolcanoService:
         Returns:
             list[VolcanoInfo]: 火山情報リスト
         """
-        url = f"{self.BASE_URL}/const/volcano_list.json"
-
-        client = self._get_client()
         try:
-            response = await client.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            return self._parse_volcano_list(data)
+            await self._load_volcano_list()
         except httpx.HTTPError as e:
-            logger.error(f"火山一覧取得エラー: {e}", exc_info=True)
+            logger.error("火山一覧取得エラー: %s", e, exc_info=True)
             return []
+        return list(self._volcanoes)
+
+    async def _load_volcano_list(self) -> None:
+        """火山一覧 JSON を取得し、内容が変わっていればパース結果と索引を作り直す
+
+        JSON は VOLCANO_LIST_TTL の間同じオブジェクトがキャッシュから返るため、
+        同一性で比較すれば TTL 内の再パースを省ける。
+        """
+        url = f"{self.BASE_URL}/const/volcano_list.json"
+        data = await self._json_cache.get_json(
+            self._get_client(), url, self.VOLCANO_LIST_TTL, timeout=self.timeout
+        )
+        if data is self._volcano_source:
+            return
+        self._volcanoes = self._parse_volcano_list(data or [])
+        self._volcano_index = {v.code: v for v in self._volcanoes}
+        self._volcano_source = data
 
     def _parse_volcano_list(self, data: list) -> list[VolcanoInfo]:
         """APIレスポンスを火山情報リストにパース"""
@@ -98,11 +139,11 @@ class VolcanoService:
                     name_en=item.get("name_en"),
                     latitude=lat,
                     longitude=lon,
-                    is_monitored=code in self.MONITORED_VOLCANOES or item.get("levelOperation", False),
+                    is_monitored=code in self._MONITORED_SET or item.get("levelOperation", False),
                 )
                 volcanoes.append(volcano)
             except Exception as e:
-                logger.error(f"火山情報パースエラー: {e}", exc_info=True)
+                logger.error("火山情報パースエラー: %s", e, exc_info=True)
                 continue
 
         return volcanoes
@@ -121,37 +162,34 @@ class VolcanoService:
         """
         火山警報を並列取得
 
-        Semaphore(10) で同時接続数を制限しつつ、asyncio.gather() で並列リクエストを実行。
+        MAX_CONCURRENT_FETCH で同時接続数を制限しつつ、asyncio.gather() で並列リクエストを実行。
 
         Returns:
             list[dict]: 火山警報リスト
         """
-        semaphore = asyncio.Semaphore(10)
-
-        async def fetch_warning(client: httpx.AsyncClient, volcano_code: int) -> Optional[dict]:
-            async with semaphore:
-                try:
-                    url = f"{self.BASE_URL}/data/warning/{volcano_code}.json"
-                    response = await client.get(url, timeout=self.timeout)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data:
-                            return self._parse_volcano_warning(data, volcano_code)
-                except httpx.HTTPError:
-                    pass
-                except Exception as e:
-                    logger.warning(f"火山警報取得エラー ({volcano_code}): {e}")
-                return None
-
-        client = self._get_client()
-        tasks = [
-            fetch_warning(client, volcano_code)
-            for volcano_code in self.MONITORED_VOLCANOES
-        ]
-        results = await asyncio.gather(*tasks)
-
+        results = await asyncio.gather(
+            *(self._fetch_volcano_warning(code) for code in self.MONITORED_VOLCANOES)
+        )
         return [w for w in results if w is not None]
 
+    async def _fetch_volcano_warning(self, volcano_code: int) -> Optional[dict]:
+        """1火山の警報を取得してパースする（取得失敗・警報なしは None）"""
+        url = f"{self.BASE_URL}/data/warning/{volcano_code}.json"
+        async with self._fetch_semaphore:
+            try:
+                # 警報の出ていない火山は 404 を返すため「データなし」としてキャッシュする
+                data = await self._json_cache.get_json(
+                    self._get_client(), url, self.WARNING_TTL, timeout=self.timeout,
+                    not_found_ok=True,
+                )
+                if data:
+                    return self._parse_volcano_warning(data, volcano_code)
+            except httpx.HTTPError as e:
+                logger.debug("火山警報取得失敗 (%s): %s", volcano_code, e)
+            except Exception as e:
+                logger.warning("火山警報取得エラー (%s): %s", volcano_code, e)
+        return None
+
     def _parse_volcano_warning(self, data: dict, volcano_code: int) -> Optional[dict]:
         """火山警報情報をパース"""
         try:
@@ -172,7 +210,7 @@ class VolcanoService:
                 "headline": data.get("headlineText", ""),
             }
         except Exception as e:
-            logger.error(f"火山警報パースエラー: {e}", exc_info=True)
+            logger.error("火山警報パースエラー: %s", e, exc_info=True)
             return None
 
     async def get_volcano_by_code(self, code: int) -> Optional[VolcanoInfo]:
@@ -185,11 +223,12 @@ class VolcanoService:
         Returns:
             VolcanoInfo: 火山情報
         """
-        all_volcanoes = await self.get_volcano_list()
-        for volcano in all_volcanoes:
-            if volcano.code == code:
-                return volcano
-        return None
+        try:
+            await self._load_volcano_list()
+        except httpx.HTTPError as e:
+            logger.error("火山一覧取得エラー: %s", e, exc_info=True)
+            return None
+        return self._volcano_index.get(code)
 
     def get_alert_level_info(self, level: int) -> dict:
         """
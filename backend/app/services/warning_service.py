@@ -7,9 +7,10 @@
 """
 import asyncio
 import httpx
-from typing import Optional
+from typing import Callable, Optional
 from datetime import datetime
 from ..models import ALLOWED_LANGUAGES, DisasterAlert
+from ..utils.http_cache import HTTP2_AVAILABLE, JsonTTLCache
 from ..utils.logger import get_logger
 from ..utils.area_codes import AREA_CODES, get_area_code
 from .area_display import (
@@ -48,6 +49,46 @@ STATIC_LANGUAGES = ALLOWED_LANGUAGES
 ACTIVE_WARNING_STATUSES = frozenset({"発表", "継続"})
 
 
+def _has_active_warning(area_types: list[dict]) -> bool:
+    """発表中・継続中の警報が1件でもあるか（平常時は全予報区でほぼ False）"""
+    return any(
+        warning.get("status") in ACTIVE_WARNING_STATUSES
+        for area_type in area_types
+        for area in area_type.get("areas", ())
+        for warning in area.get("warnings", ())
+    )
+
+
+# 特別警報のみを取得するときの重要度フィルタ
+_SPECIAL_ONLY = frozenset({"extreme"})
+
+# 重要度 -> アラートタイプ（該当しない重要度は "watch"）
+_ALERT_TYPES = {"extreme": "special_warning", "high": "warning", "medium": "advisory"}
+
+
+def _code_row(info: dict, lang: str) -> tuple[str, str, str]:
+    """警報コード情報から (警報名, 重要度, アラートタイプ) を組み立てる
+
+    警報名は指定言語 → 英語 → 日本語の順にフォールバックする。
+    """
+    severity = info["severity"]
+    name = info.get(lang, info.get("en", info.get("ja", "")))
+    return name, severity, _ALERT_TYPES.get(severity, "watch")
+
+
+# (警報コード, 言語) -> (警報名, 重要度, アラートタイプ)。警報1件ごとの dict.get の連鎖を1回の参照にする
+_CODE_TABLE: dict[tuple[str, str], tuple[str, str, str]] = {
+    (code, lang): _code_row(info, lang)
+    for code, info in WARNING_NAMES.items()
+    for lang in STATIC_LANGUAGES
+}
+
+# 言語 -> 説明文テンプレートの format（警報1件ごとのテンプレート引きと属性参照を省く）
+_DESC_FMT: dict[str, Callable[..., str]] = {
+    lang: template.format for lang, template in WARNING_DESCRIPTION_TEMPLATES.items()
+}
+
+
 class WarningService:
     """気象庁の警報・注意報を取得するサービス"""
 
@@ -57,10 +98,29 @@ class WarningService:
         self.timeout = settings.api_timeout
         self._translator = translator  # TranslatorServiceへの参照（遅延初期化）
         self._client: Optional[httpx.AsyncClient] = None
+        # 気象庁の警報 JSON のキャッシュ（分単位でしか更新されない）
+        self._json_cache = JsonTTLCache()
+        # 府県予報区コード -> 警報 JSON の URL（静的なので初期化時に1回だけ組み立てる）
+        self._office_urls: dict[str, str] = {
+            code: f"{self.BASE_URL}/warning/data/warning/{code}.json"
+            for code in all_forecast_offices()
+        }
+
+    # 警報 JSON のキャッシュ有効期間（秒）
+    WARNING_TTL = 60.0
 
     def _get_client(self) -> httpx.AsyncClient:
+        """全予報区の警報取得で共有する httpx.AsyncClient を遅延初期化して返す
+
+        並列取得（Semaphore(10)）の同時接続をすべてキープアライブで使い回せるよう、
+        プール上限を並列数より大きく取る。h2 が入っていれば HTTP/2 で1本の接続に多重化する。
+        """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                http2=HTTP2_AVAILABLE,
+            )
         return self._client
 
     async def close(self) -> None:
@@ -164,13 +224,15 @@ class WarningService:
 
         1 予報区が落ちても他の予報区の警報は出す（都道府県まるごと無言でゼロ件にしない）。
         """
-        url = f"{self.BASE_URL}/warning/data/warning/{area_code}.json"
+        url = self._office_urls.get(area_code)
+        if url is None:
+            url = f"{self.BASE_URL}/warning/data/warning/{area_code}.json"
         try:
-            response = await self._get_client().get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            return await self._json_cache.get_json(
+                self._get_client(), url, self.WARNING_TTL, timeout=self.timeout
+            )
         except httpx.HTTPError as e:
-            logger.error(f"警報情報取得エラー ({area_code}): {e}", exc_info=True)
+            logger.error("警報情報取得エラー (%s): %s", area_code, e, exc_info=True)
             return None
 
     @staticmethod
@@ -198,22 +260,43 @@ class WarningService:
         # 指定言語がなければ英語、それもなければ日本語
         return warning_info.get(lang, warning_info.get("en", warning_info.get("ja", "")))
 
+    def _get_code_row(self, code: str, lang: str) -> tuple[str, str, str]:
+        """警報コードの (警報名, 重要度, アラートタイプ) を取得（索引にないコードはその場で組み立てる）"""
+        return _CODE_TABLE.get((code, lang)) or _code_row(self.WARNING_CODES[code], lang)
+
     def _get_area_name(self, area_code: str, lang: str, fallback: str = "") -> str:
         """地域コードを指定言語の地名にする（実体は `area_display`）"""
         return resolve_area_name(area_code, lang, fallback)
 
     def _get_description(self, area_name: str, warning_name: str, lang: str) -> str:
         """説明文を指定言語で生成"""
-        template = self.DESCRIPTION_TEMPLATES.get(lang, self.DESCRIPTION_TEMPLATES["en"])
-        return template.format(area=area_name, warning=warning_name)
-
-    def _parse_warnings(self, data: dict, area_code: str, lang: str = "ja") -> list[DisasterAlert]:
-        """APIレスポンスを警報リストにパース（重複排除済み）"""
+        fmt = _DESC_FMT.get(lang) or _DESC_FMT["en"]
+        return fmt(area=area_name, warning=warning_name)
+
+    def _parse_warnings(
+        self,
+        data: dict,
+        area_code: str,
+        lang: str = "ja",
+        *,
+        date_str: Optional[str] = None,
+        severity_filter: Optional[frozenset[str]] = None,
+    ) -> list[DisasterAlert]:
+        """APIレスポンスを警報リストにパース（重複排除済み）
+
+        date_str は警報IDの日付部分（YYYYMMDD）。全国取得では呼び出し側で1回だけ
+        求めて渡し、省略時はここで1回求める。
+        severity_filter を渡すと、その重要度の警報だけをグループ化の段階で残す
+        （対象外の警報は地名解決も DisasterAlert の生成も行わない）。
+        """
         report_datetime = data.get("reportDatetime", "")
 
         area_types = data.get("areaTypes", [])
-        if not area_types:
+        # 有効な警報が無ければ、地名解決やグループ化を行わずに返す
+        if not area_types or not _has_active_warning(area_types):
             return []
+        if date_str is None:
+            date_str = datetime.now().strftime('%Y%m%d')
 
         # 都道府県名をフォールバック用に取得 (reverse lookup: area_code -> 都道府県名)
         prefecture_name = next(
@@ -240,6 +323,11 @@ class WarningService:
                     code = warning.get("code", "")
                     status = warning.get("status", "")
                     if status in ACTIVE_WARNING_STATUSES and code in self.WARNING_CODES:
+                        if (
+                            severity_filter is not None
+                            and self.WARNING_CODES[code]["severity"] not in severity_filter
+                        ):
+                            continue
                         announced.add(code)
                         if not is_known_area(area_id):
                             continue
@@ -256,9 +344,8 @@ class WarningService:
         # グループ化された警報をアラートに変換
         alerts = []
         for code, area_ids in grouped.items():
-            warning_info = self.WARNING_CODES[code]
-            warning_name = self._get_warning_name(code, lang)
-            title_ja = self._get_warning_name(code, "ja")
+            title_ja = self._get_code_row(code, "ja")[0]
+            warning_name, severity, alert_type = self._get_code_row(code, lang)
             title_translated = warning_name if lang != "ja" else None
 
             # 対象地域をまとめて表示。細分区域が引けなければ都道府県まで落とす。
@@ -282,11 +369,11 @@ class WarningService:
                 if description_translated:
                     description_translated += f"\n⚠ {guidance_text}"
 
-            alert_id = f"{area_code}_{code}_{datetime.now().strftime('%Y%m%d')}"
+            alert_id = f"{area_code}_{code}_{date_str}"
 
             alerts.append(DisasterAlert(
                 id=alert_id,
-                type=self._get_alert_type(warning_info["severity"]),
+                type=alert_type,
                 title=title_ja,
                 title_translated=title_translated,
                 description=description_ja,
@@ -294,7 +381,7 @@ class WarningService:
                 area=combined_area,
                 issued_at=report_datetime,
                 expires_at=None,
-                severity=warning_info["severity"]
+                severity=severity
             ))
 
         # 重要度順にソート (extreme > high > medium > low)
@@ -305,14 +392,7 @@ class WarningService:
 
     def _get_alert_type(self, severity: str) -> str:
         """重要度からアラートタイプを決定"""
-        if severity == "extreme":
-            return "special_warning"
-        elif severity == "high":
-            return "warning"
-        elif severity == "medium":
-            return "advisory"
-        else:
-            return "watch"
+        return _ALERT_TYPES.get(severity, "watch")
 
     async def _parse_warnings_with_ai(self, data: dict, area_code: str, lang: str) -> list[DisasterAlert]:
         """
@@ -325,8 +405,9 @@ class WarningService:
         report_datetime = data.get("reportDatetime", "")
 
         area_types = data.get("areaTypes", [])
-        if not area_types:
+        if not area_types or not _has_active_warning(area_types):
             return []
+        date_str = datetime.now().strftime('%Y%m%d')
 
         # 1. 警報コード別にグループ化して重複排除
         #
@@ -358,61 +439,65 @@ class WarningService:
         # グループ化された警報のメタデータを生成
         pending_items: list[dict] = []
         for code, area_names_ja in grouped.items():
-            warning_info = self.WARNING_CODES[code]
-            title_ja = self._get_warning_name(code, "ja")
-            severity = warning_info.get("severity", "medium")
-            alert_id = f"{area_code}_{code}_{datetime.now().strftime('%Y%m%d')}"
-            combined_area_ja = "、".join(area_names_ja)
-
+            # 警報名・重要度・アラートタイプは平坦な索引から引く（英語名はフォールバック用）
+            title_ja, severity, alert_type = self._get_code_row(code, "ja")
             pending_items.append({
-                "code": code,
                 "title_ja": title_ja,
+                "title_en": self._get_code_row(code, "en")[0],
                 "severity": severity,
-                "alert_id": alert_id,
-                "area_name_ja": combined_area_ja,
+                "alert_type": alert_type,
+                "alert_id": f"{area_code}_{code}_{date_str}",
+                "area_name_ja": "、".join(area_names_ja),
             })
 
         if not pending_items:
             return []
 
-        # 2. 全警報のAI翻訳を並列実行
-        async def translate_single(item: dict) -> tuple[dict, Optional[dict], Optional[str]]:
-            """単一警報の翻訳タスク。(metadata, generated_or_None, area_translated_or_None) を返す。"""
-            try:
-                generated, area_translated = await asyncio.gather(
+        # 2. 全警報の文面生成と地名翻訳を並列実行
+        # 同じ地域に複数の警報が出ていることが多いため、地名翻訳は重複を除いて1回ずつにする
+        unique_areas = list(dict.fromkeys(item["area_name_ja"] for item in pending_items))
+        generated_results, area_results = await asyncio.gather(
+            asyncio.gather(
+                *(
                     self.translator.generate_warning_text(
                         warning_name_ja=item["title_ja"],
                         target_lang=lang,
                         area_name=item["area_name_ja"],
                         severity=item["severity"],
-                    ),
-                    self.translator.translate_location(item["area_name_ja"], lang),
-                )
-                return (item, generated, area_translated)
-            except Exception as e:
-                logger.error(f"AI生成エラー: {e}", exc_info=True)
-                return (item, None, None)
-
-        tasks = [translate_single(item) for item in pending_items]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+                    )
+                    for item in pending_items
+                ),
+                return_exceptions=True,
+            ),
+            asyncio.gather(
+                *(self.translator.translate_location(area, lang) for area in unique_areas),
+                return_exceptions=True,
+            ),
+        )
+        area_translations: dict[str, Optional[str]] = {}
+        for area, area_result in zip(unique_areas, area_results):
+            if isinstance(area_result, BaseException):
+                logger.error("地名翻訳エラー (%s): %s", area, area_result, exc_info=area_result)
+                area_result = None
+            area_translations[area] = area_result
 
         # 3. 結果を DisasterAlert に変換
+        # gather(return_exceptions=True) により各警報のエラーは独立して英語版へフォールバックする
         alerts: list[DisasterAlert] = []
-        for result in results:
-            # gather(return_exceptions=True) により例外オブジェクトが返る可能性を処理
-            if isinstance(result, BaseException):
-                logger.error(f"並列翻訳で予期しないエラー: {result}", exc_info=True)
-                continue
-
-            item, generated, area_translated = result
+        for item, generated in zip(pending_items, generated_results):
+            if isinstance(generated, BaseException):
+                logger.error("AI生成エラー: %s", generated, exc_info=generated)
+                generated = None
+            area_translated = area_translations[item["area_name_ja"]]
+            description_ja = f"{item['area_name_ja']}に{item['title_ja']}が発表されています。"
 
             if generated is not None and area_translated is not None:
                 alerts.append(DisasterAlert(
                     id=item["alert_id"],
-                    type=self._get_alert_type(item["severity"]),
+                    type=item["alert_type"],
                     title=item["title_ja"],
                     title_translated=generated.get("name"),
-                    description=f"{item['area_name_ja']}に{item['title_ja']}が発表されています。",
+                    description=description_ja,
                     description_translated=generated.get("description"),
                     area=area_translated,
                     issued_at=report_datetime,
@@ -424,12 +509,12 @@ class WarningService:
                 # フォールバック: 英語版を使用
                 alerts.append(DisasterAlert(
                     id=item["alert_id"],
-                    type=self._get_alert_type(item["severity"]),
+                    type=item["alert_type"],
                     title=item["title_ja"],
-                    title_translated=self._get_warning_name(item["code"], "en"),
-                    description=f"{item['area_name_ja']}に{item['title_ja']}が発表されています。",
-                    description_translated=self._get_description(
-                        item["area_name_ja"], self._get_warning_name(item["code"], "en"), "en"
+                    title_translated=item["title_en"],
+                    description=description_ja,
+                    description_translated=_DESC_FMT["en"](
+                        area=item["area_name_ja"], warning=item["title_en"]
                     ),
                     area=item["area_name_ja"],
                     issued_at=report_datetime,
@@ -439,7 +524,9 @@ class WarningService:
 
         return alerts
 
-    async def get_all_prefectures_warnings(self) -> list[DisasterAlert]:
+    async def get_all_prefectures_warnings(
+        self, severity_filter: Optional[frozenset[str]] = None
+    ) -> list[DisasterAlert]:
         """
         全国の警報・注意報を取得
 
@@ -448,24 +535,36 @@ class WarningService:
         そこで特別警報が出ても `get_special_warnings` が検出できなかった
         （＝Push通知も飛ばなかった）。
 
+        Args:
+            severity_filter: 指定した重要度の警報だけを返す（None なら全件）
+
         Returns:
             list[DisasterAlert]: 全国の警報・注意報リスト
         """
         all_alerts = []
         semaphore = asyncio.Semaphore(10)  # 同時接続制限
+        # 警報IDの日付は全予報区で共通（途中で日付が変わってもIDがずれない）
+        date_str = datetime.now().strftime('%Y%m%d')
 
         async def fetch_office(area_code: str) -> list[DisasterAlert]:
             async with semaphore:
                 data = await self._fetch_warning_payload(area_code)
-                if data is None:
-                    return []
-                return self._parse_warnings(data, area_code)
+            if data is None:
+                return []
+            # 1予報区のパース失敗で TaskGroup 全体（＝全国分）を取り消さない
+            try:
+                return self._parse_warnings(
+                    data, area_code, date_str=date_str, severity_filter=severity_filter
+                )
+            except Exception as e:
+                logger.error("警報パースエラー (%s): %s", area_code, e, exc_info=True)
+                return []
 
-        results = await asyncio.gather(
-            *(fetch_office(code) for code in all_forecast_offices())
-        )
-        for alerts in results:
-            all_alerts.extend(alerts)
+        # TaskGroup: 呼び出し元がキャンセルされたら取得中の全タスクも確実に取り消す
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_office(code)) for code in self._office_urls]
+        for task in tasks:
+            all_alerts.extend(task.result())
 
         return all_alerts
 
@@ -476,8 +575,7 @@ class WarningService:
         Returns:
             list[DisasterAlert]: 特別警報リスト
         """
-        all_alerts = await self.get_all_prefectures_warnings()
-        return [alert for alert in all_alerts if alert.severity == "extreme"]
+        return await self.get_all_prefectures_warnings(severity_filter=_SPECIAL_ONLY)
 
     def get_area_code(self, prefecture_name: str) -> Optional[str]:
         """都道府県名から地域コードを取得"""
@@ -4,6 +4,7 @@
 統一されたエラーハンドリングを提供するデコレータを定義します。
 すべてのエンドポイントで一貫したエラー処理を実現します。
 """
+import inspect
 from functools import wraps
 from fastapi import HTTPException
 from typing import Callable, Any
@@ -14,6 +15,9 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# 本番環境かどうか（環境は起動中に変わらないため、例外のたびに設定を読まない）
+_IS_PRODUCTION = settings.environment == "production"
+
 
 def handle_errors(func: Callable) -> Callable:
     """
@@ -29,12 +33,8 @@ def handle_errors(func: Callable) -> Callable:
             # 処理
             pass
     """
-    import inspect
-    
     def _handle_exception(e: Exception) -> None:
         """例外を処理してHTTPExceptionを発生させる"""
-        is_production = settings.environment == "production"
-        
         if isinstance(e, HTTPException):
             raise
         elif isinstance(e, DisasterAlertError):
@@ -42,18 +42,18 @@ def handle_errors(func: Callable) -> Callable:
             if isinstance(e, APIError):
                 raise HTTPException(
                     status_code=e.status_code,
-                    detail=e.message if not is_production else "内部サーバーエラーが発生しました"
+                    detail=e.message if not _IS_PRODUCTION else "内部サーバーエラーが発生しました"
                 )
             else:
                 raise HTTPException(
                     status_code=500,
-                    detail=str(e) if not is_production else "内部サーバーエラーが発生しました"
+                    detail=str(e) if not _IS_PRODUCTION else "内部サーバーエラーが発生しました"
                 )
         else:
             logger.error(f"エラー発生: {str(e)}", exc_info=True)
             raise HTTPException(
                 status_code=500,
-                detail=str(e) if not is_production else "内部サーバーエラーが発生しました"
+                detail=str(e) if not _IS_PRODUCTION else "内部サーバーエラーが発生しました"
             )
     
     if inspect.iscoroutinefunction(func):
@@ -0,0 +1,84 @@
+"""
+JSON 取得結果のインプロセス TTL キャッシュ
+
+気象庁の警報・火山 JSON は分単位でしか更新されないため、URL をキーに
+デコード済みの結果を一定時間使い回し、リクエストのたびに取りに行かない。
+同じ URL への同時アクセスは1回の取得にまとめる。
+デコードは標準の json より速い orjson で行う。
+
+返り値は呼び出し元の間で共有されるため、書き換えてはいけない。
+"""
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import orjson
+
+# HTTP/2 対応（オプショナル依存: httpx[http2] で入る h2 がある場合のみ有効）
+# 予報区・火山の並列取得を1本の接続に多重化できる
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class JsonTTLCache:
+    """URL をキーにした JSON レスポンスの TTL キャッシュ"""
+
+    def __init__(self) -> None:
+        # URL -> (有効期限 [time.monotonic()], デコード済み JSON)
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # URL -> 取得中のロック（同時アクセスを1回の取得にまとめる）
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        ttl: float = 60.0,
+        timeout: Any = httpx.USE_CLIENT_DEFAULT,
+        *,
+        not_found_ok: bool = False,
+    ) -> Any:
+        """
+        URL の JSON を取得する（TTL 内はキャッシュを返す）
+
+        not_found_ok=True の場合のみ、404 を「データなし」として None をキャッシュする
+        （気象庁は警報の出ていない火山で 404 を返すため、毎回取りに行かないようにする）。
+        それ以外の HTTP エラー（not_found_ok=False の 404 を含む）はキャッシュせず、
+        httpx.HTTPError をそのまま送出する。
+
+        Args:
+            client: 共有の httpx.AsyncClient
+            url: 取得する URL
+            ttl: キャッシュの有効期間（秒）
+            timeout: リクエストのタイムアウト
+            not_found_ok: 404 を None としてキャッシュするか
+
+        Returns:
+            デコード済みの JSON、not_found_ok=True で 404 の場合は None
+        """
+        entry = self._entries.get(url)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        async with self._locks.setdefault(url, asyncio.Lock()):
+            # ロック待ちの間に他のタスクが取得済みならそれを返す
+            entry = self._entries.get(url)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            response = await client.get(url, timeout=timeout)
+            if not_found_ok and response.status_code == 404:
+                data = None
+            else:
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            self._entries[url] = (time.monotonic() + ttl, data)
+            return data
+
+    def clear(self) -> None:
+        """キャッシュをすべて破棄する"""
+        self._entries.clear()
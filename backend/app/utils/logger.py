@@ -62,5 +62,7 @@ def get_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     handler.setFormatter(_create_formatter())
     logger.addHandler(handler)
     logger.setLevel(log_level)
+    # 自前のハンドラーで出力済みなので、ルートロガーへ伝播させて二重に整形・出力しない
+    logger.propagate = False
 
     return logger
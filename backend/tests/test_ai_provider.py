@@ -1,6 +1,9 @@
 """
 AIProvider のユニットテスト
 """
+import json
+from unittest.mock import AsyncMock
+
 import pytest
 import httpx
 
@@ -51,6 +54,33 @@ def test_get_active_provider_none():
     assert provider.get_active_provider() is None
 
 
+# ---------------------------------------------------------------------------
+# translate_text
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_translate_text_dispatches_to_active_provider(monkeypatch):
+    """初期化時に解決したプロバイダーの翻訳メソッドが呼ばれる"""
+    calls: list[str] = []
+
+    async def fake_claude(self, text, target_lang):
+        calls.append(f"claude:{text}:{target_lang}")
+        return "Tokyo"
+
+    monkeypatch.setattr(AIProvider, "_translate_with_claude", fake_claude)
+    provider = _make_provider(ai_provider="claude")
+
+    assert await provider.translate_text("東京", "en") == "Tokyo"
+    assert calls == ["claude:東京:en"]
+
+
+@pytest.mark.asyncio
+async def test_translate_text_without_provider_returns_none():
+    """プロバイダー未設定なら API を呼ばず None を返す"""
+    provider = _make_provider(ai_provider="auto", gemini_key=None, anthropic_key=None)
+    assert await provider.translate_text("東京", "en") is None
+
+
 # ---------------------------------------------------------------------------
 # extract_json
 # ---------------------------------------------------------------------------
@@ -69,6 +99,12 @@ def test_extract_json_code_block():
     assert result == {"title": "Earthquake Alert"}
 
 
+def test_extract_json_code_block_without_language():
+    """言語指定のないコードブロックも抽出され、ブレース抽出まで落ちない"""
+    raw = '```\n{"title": "Tsunami"}\n```'
+    assert AIProvider.extract_json(raw) == {"title": "Tsunami"}
+
+
 def test_extract_json_brace_extraction():
     """ブレース抽出フォールバックで最初の { から最後の } までが抽出される"""
     raw = 'Some preamble text {"fallback": true} trailing text'
@@ -81,3 +117,89 @@ def test_extract_json_invalid_returns_none():
     raw = "This is just plain text without any JSON."
     result = AIProvider.extract_json(raw)
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# generate_json（再試行）
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_generate_json_dispatches_to_active_provider(monkeypatch):
+    """初期化時に解決したプロバイダーの生成メソッドが呼ばれる"""
+    async def fake_gemini(self, prompt, max_tokens, system=None):
+        return {"provider": "gemini", "max_tokens": max_tokens}
+
+    monkeypatch.setattr(AIProvider, "_generate_with_gemini", fake_gemini)
+    provider = _make_provider(ai_provider="auto", gemini_key="gk", anthropic_key="ak")
+
+    assert await provider.generate_json("prompt", max_tokens=1500) == {
+        "provider": "gemini",
+        "max_tokens": 1500,
+    }
+
+
+@pytest.mark.asyncio
+async def test_generate_json_without_provider_returns_none():
+    """プロバイダー未設定なら API を呼ばず None を返す"""
+    provider = _make_provider(ai_provider="auto", gemini_key=None, anthropic_key=None)
+    assert await provider.generate_json("prompt") is None
+
+
+def _mock_transport(provider: AIProvider, responses: list[httpx.Response]) -> list[httpx.Request]:
+    """AIProvider の HTTP クライアントを、応答を順に返すモックに差し替える"""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1]
+
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_generate_json_retries_on_rate_limit(monkeypatch):
+    """429 応答はバックオフ後に再試行され、成功した応答がパースされる"""
+    provider = _make_provider(ai_provider="claude")
+    requests = _mock_transport(provider, [
+        httpx.Response(429),
+        httpx.Response(200, json={"content": [{"text": '{"title": "ok"}'}]}),
+    ])
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("app.services.ai_provider.asyncio.sleep", fake_sleep)
+
+    assert await provider.generate_json("prompt") == {"title": "ok"}
+    assert len(requests) == 2
+    assert len(sleeps) == 1 and 1 <= sleeps[0] < 2
+
+
+@pytest.mark.asyncio
+async def test_generate_json_gives_up_after_max_retries(monkeypatch):
+    """5xx が続く場合は再試行上限で諦めて None を返す"""
+    provider = _make_provider(ai_provider="claude")
+    requests = _mock_transport(provider, [httpx.Response(503)])
+    monkeypatch.setattr("app.services.ai_provider.asyncio.sleep", AsyncMock())
+
+    assert await provider.generate_json("prompt") is None
+    assert len(requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_generate_json_claude_caches_system_prompt():
+    """共通指示は cache_control 付きの system ブロックとして送られる"""
+    provider = _make_provider(ai_provider="claude")
+    requests = _mock_transport(provider, [
+        httpx.Response(200, json={"content": [{"text": '{"name": "x"}'}]}),
+    ])
+
+    assert await provider.generate_json("user prompt", system="shared rules") == {"name": "x"}
+
+    body = json.loads(requests[0].content)
+    assert body["system"] == [
+        {"type": "text", "text": "shared rules", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert body["messages"] == [{"role": "user", "content": "user prompt"}]
@@ -0,0 +1,83 @@
+"""
+JsonTTLCache のユニットテスト
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.utils.http_cache import JsonTTLCache
+
+
+def _client(handler) -> tuple[httpx.AsyncClient, list[httpx.Request]]:
+    """リクエストを記録するモッククライアントを返す"""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(record)), requests
+
+
+@pytest.mark.asyncio
+async def test_get_json_cached_within_ttl():
+    """TTL 内の呼び出し（同時アクセス含む）は1回の取得にまとめられる"""
+    client, requests = _client(lambda request: httpx.Response(200, json={"level": 3}))
+    cache = JsonTTLCache()
+
+    results = await asyncio.gather(
+        *(cache.get_json(client, "https://example.test/a.json") for _ in range(5))
+    )
+
+    assert results == [{"level": 3}] * 5
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_json_refetches_after_ttl():
+    """TTL を過ぎたら再取得する"""
+    client, requests = _client(lambda request: httpx.Response(200, json=[]))
+    cache = JsonTTLCache()
+
+    await cache.get_json(client, "https://example.test/a.json", ttl=0.0)
+    await cache.get_json(client, "https://example.test/a.json", ttl=0.0)
+
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_json_caches_not_found_as_none():
+    """not_found_ok=True の場合、404 は None としてキャッシュされる"""
+    client, requests = _client(lambda request: httpx.Response(404))
+    cache = JsonTTLCache()
+
+    for _ in range(2):
+        assert await cache.get_json(
+            client, "https://example.test/none.json", not_found_ok=True
+        ) is None
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_json_not_found_raises_by_default():
+    """既定では 404 も送出され、キャッシュされない"""
+    client, requests = _client(lambda request: httpx.Response(404))
+    cache = JsonTTLCache()
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.get_json(client, "https://example.test/none.json")
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_json_does_not_cache_errors():
+    """404 以外のエラーは送出され、キャッシュされない"""
+    client, requests = _client(lambda request: httpx.Response(503))
+    cache = JsonTTLCache()
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await cache.get_json(client, "https://example.test/down.json")
+    assert len(requests) == 2
@@ -5,6 +5,7 @@ SQLAlchemy async session を使った DB ベースのサブスクリプション
 テスト毎にインメモリ SQLite を使い分離する。
 """
 import asyncio
+import threading
 import pytest
 import pytest_asyncio
 from unittest.mock import patch, MagicMock
@@ -63,6 +64,8 @@ def _make_service(
     service._vapid_public_key = vapid_public
     service._vapid_private_key = vapid_private
     service._vapid_claims_email = vapid_email
+    service._executor = None
+    service._is_enabled = service._compute_enabled(pywebpush_available)
     return service
 
 
@@ -163,6 +166,39 @@ async def test_subscribe_legacy_row_gets_token_backfilled(db_session):
     assert len(token) >= 32
 
 
+@pytest.mark.asyncio
+async def test_subscribe_many_batch(db_session, monkeypatch):
+    """一括登録は1回の commit で新規・既存をまとめて書き込み、endpoint ごとの token を返す"""
+    await _seed_subscriptions(db_session, [{"endpoint": "https://push.example.com/legacy"}])
+    commits = 0
+    original_commit = AsyncSession.commit
+
+    async def counting_commit(self):
+        nonlocal commits
+        commits += 1
+        await original_commit(self)
+
+    monkeypatch.setattr(AsyncSession, "commit", counting_commit)
+
+    service = _make_service()
+    subs = [
+        PushSubscription(endpoint=f"https://push.example.com/sub{i}", keys={"p256dh": f"k{i}", "auth": f"a{i}"})
+        for i in range(3)
+    ] + [PushSubscription(endpoint="https://push.example.com/legacy", keys={"p256dh": "new", "auth": "new"})]
+
+    tokens = await service.subscribe_many(subs, language="en")
+
+    assert commits == 1
+    assert len(tokens) == 4
+    assert all(isinstance(t, str) and len(t) >= 32 for t in tokens.values())
+    async with db_session() as session:
+        rows = {r.endpoint: r for r in (await session.execute(select(PushSubscriptionRow))).scalars()}
+    assert len(rows) == 4
+    legacy = rows["https://push.example.com/legacy"]
+    assert legacy.key_p256dh == "new" and legacy.language == "en"
+    assert legacy.management_token == tokens["https://push.example.com/legacy"]
+
+
 # ---------------------------------------------------------------------------
 # unsubscribe (Wave 2: token 必須)
 # ---------------------------------------------------------------------------
@@ -343,6 +379,33 @@ def test_is_enabled_without_keys():
         assert service.is_enabled is False
 
 
+def test_is_enabled_without_pywebpush():
+    """pywebpush がない場合は鍵が揃っていても False"""
+    service = _make_service(
+        vapid_public="pub_key",
+        vapid_private="priv_key",
+        vapid_email="admin@example.com",
+        pywebpush_available=False,
+    )
+    assert service.is_enabled is False
+
+
+def test_is_enabled_computed_once_in_init():
+    """利用可否は __init__ で1回だけ判定される"""
+    mock_settings = MagicMock()
+    mock_settings.vapid_public_key = "pub_key"
+    mock_settings.vapid_private_key = "priv_key"
+    mock_settings.vapid_claims_email = "admin@example.com"
+    with patch.object(push_service_module, "settings", mock_settings), \
+            patch.object(push_service_module, "PYWEBPUSH_AVAILABLE", True):
+        service = PushNotificationService()
+
+    with patch.object(PushNotificationService, "_compute_enabled") as compute:
+        assert service.is_enabled is True
+        assert service.is_enabled is True
+    compute.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # send_notification (disabled)
 # ---------------------------------------------------------------------------
@@ -361,6 +424,108 @@ async def test_send_notification_disabled_raises(db_session):
             await service.send_notification(title="test", body="test")
 
 
+@pytest.mark.asyncio
+async def test_send_notification_fans_out_concurrently(db_session):
+    """全登録者への送信が MAX_CONCURRENT_PUSH 件ずつ並列に行われる"""
+    total = PushNotificationService.MAX_CONCURRENT_PUSH * 20
+    await _seed_subscriptions(db_session, [
+        {"endpoint": f"https://push.example.com/c{i}", "keys": {"p256dh": "k", "auth": "a"}}
+        for i in range(total)
+    ])
+    service = _make_service(vapid_public="pub", vapid_private="priv", vapid_email="a@example.com")
+
+    # MAX_CONCURRENT_PUSH 件が同時に送信中にならないと barrier を抜けられない（逐次なら timeout で失敗）
+    barrier = threading.Barrier(service.MAX_CONCURRENT_PUSH)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_webpush(**kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            barrier.wait(timeout=5)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    try:
+        with patch("app.services.push_service.PYWEBPUSH_AVAILABLE", True), \
+                patch("app.services.push_service.webpush", fake_webpush, create=True):
+            sent = await service.send_notification(title="test", body="test")
+    finally:
+        await service.close()
+
+    # CPU 数に依存する既定 executor ではなく、同時送信数の上限まで並列になる
+    assert sent == total
+    assert not barrier.broken
+    assert peak <= service.MAX_CONCURRENT_PUSH
+
+
+@pytest.mark.asyncio
+async def test_send_notification_passes_targets_to_webpush(db_session):
+    """登録者の endpoint・鍵がそのまま webpush の送信先になる"""
+    await _seed_subscriptions(db_session, [
+        {"endpoint": "https://push.example.com/t1", "keys": {"p256dh": "k1", "auth": "a1"}},
+        {"endpoint": "https://push.example.com/t2", "keys": {"p256dh": "k2", "auth": "a2"}},
+    ])
+    service = _make_service(vapid_public="pub", vapid_private="priv", vapid_email="a@example.com")
+    received: list[dict] = []
+
+    def fake_webpush(subscription_info, **kwargs):
+        received.append(subscription_info)
+
+    try:
+        with patch("app.services.push_service.webpush", fake_webpush, create=True):
+            assert await service.send_notification(title="test", body="test") == 2
+    finally:
+        await service.close()
+
+    assert sorted(received, key=lambda sub: sub["endpoint"]) == [
+        {"endpoint": "https://push.example.com/t1", "keys": {"p256dh": "k1", "auth": "a1"}},
+        {"endpoint": "https://push.example.com/t2", "keys": {"p256dh": "k2", "auth": "a2"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_regional_alert_filters_by_region(db_session, monkeypatch):
+    """監視地域が一致する登録者と、地域未設定（全国監視）の登録者だけに送る"""
+    async with db_session() as session:
+        for i, regions in enumerate(['["130000"]', '["130000"]', '["270000"]', None, "broken"]):
+            session.add(PushSubscriptionRow(
+                endpoint=f"https://push.example.com/r{i}",
+                key_p256dh="k",
+                key_auth="a",
+                preferred_regions=regions,
+            ))
+        await session.commit()
+
+    service = _make_service(vapid_public="pub", vapid_private="priv", vapid_email="a@example.com")
+    sent: list[str] = []
+
+    async def fake_dispatch(targets, payload):
+        sent.extend(t["endpoint"] for t in targets)
+        return len(targets)
+
+    monkeypatch.setattr(service, "_dispatch_push", fake_dispatch)
+    checked: list = []
+    original_match = service._regions_match
+    monkeypatch.setattr(
+        service, "_regions_match", lambda regions, areas: checked.append(regions) or original_match(regions, areas)
+    )
+
+    with patch("app.services.push_service.PYWEBPUSH_AVAILABLE", True):
+        count = await service.send_regional_alert("weather", "msg", "high", ["130000", "140000"])
+
+    # 不正な JSON は全国監視とみなす
+    assert sorted(sent) == [f"https://push.example.com/r{i}" for i in (0, 1, 3, 4)]
+    assert count == 4
+    # 同じ地域設定は1回だけ判定される
+    assert sorted(map(str, checked)) == sorted(['["130000"]', '["270000"]', "None", "broken"])
+
+
 # ---------------------------------------------------------------------------
 # _build_alert_title (共通化されたタイトル生成)
 # ---------------------------------------------------------------------------
@@ -406,3 +571,42 @@ async def test_get_subscription_count_with_data(db_session):
 
     service = _make_service()
     assert await service.get_subscription_count() == 3
+
+
+# ---------------------------------------------------------------------------
+# SQLite WAL（読み取りと書き込みが互いを待たない）
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_do_not_block(tmp_path):
+    """WAL モードでは読み取りトランザクションを開いたままでも書き込みがコミットできる
+
+    ロールバックジャーナルでは読み取り側の共有ロックでコミットが
+    "database is locked" になる。
+    """
+    from app.database import _create_engine
+
+    engine = _create_engine(f"sqlite+aiosqlite:///{tmp_path / 'push.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        assert (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar() == "wal"
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        with patch("app.services.push_service.async_session", factory):
+            service = _make_service()
+            async with engine.connect() as reader:
+                await reader.exec_driver_sql("BEGIN")
+                count_sql = "SELECT COUNT(*) FROM push_subscriptions"
+                assert (await reader.exec_driver_sql(count_sql)).scalar() == 0
+
+                async with factory() as writer:
+                    writer.add(PushSubscriptionRow(endpoint="https://push.example.com/w", key_p256dh="", key_auth=""))
+                    await asyncio.wait_for(writer.commit(), timeout=2)
+
+                # 開いたままの読み取りトランザクションはコミット前のスナップショットを見る
+                assert (await reader.exec_driver_sql(count_sql)).scalar() == 0
+                await reader.rollback()
+            assert await service.get_subscription_count() == 1
+    finally:
+        await engine.dispose()
@@ -2,6 +2,7 @@
 ShelterService のユニットテスト
 """
 import csv
+import json
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -23,38 +24,39 @@ def _write_csv(path: Path, rows: list[dict], fieldnames: list[str] | None = None
         writer.writerows(rows)
 
 
-def _make_service(tmp_path: Path, csv_path: str = "", csv_rows: list[dict] | None = None):
+def _build_service(data_dir: Path, csv_path: str):
     """テスト用 ShelterService を構築する
 
     ShelterService.__init__ は内部で from ..config import settings を行うため、
-    app.config.settings をパッチする。
+    構築中だけ app.config.settings をパッチする。
     """
-    data_dir = tmp_path / "shelters"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # CSV ファイルを作成
-    actual_csv_path = csv_path
-    if csv_rows is not None:
-        csv_file = tmp_path / "shelters.csv"
-        _write_csv(csv_file, csv_rows)
-        actual_csv_path = str(csv_file)
-
     mock_settings = MagicMock()
     mock_settings.shelter_data_dir = str(data_dir)
-    mock_settings.shelter_csv_path = actual_csv_path
+    mock_settings.shelter_csv_path = csv_path
 
     with patch("app.config.settings", mock_settings):
         from app.services.shelter_service import ShelterService
         return ShelterService()
 
 
+def _service_from_rows(tmp_path_factory, name: str, rows: list[dict]):
+    """CSVを書き出して ShelterService を構築する（セッションで1回だけ）"""
+    base = tmp_path_factory.mktemp(name)
+    csv_file = base / "shelters.csv"
+    _write_csv(csv_file, rows)
+    return _build_service(base / "shelters", str(csv_file))
+
+
 # ---------------------------------------------------------------------------
-# CSV 読み込み
+# Fixtures（CSVの書き出し・パースはセッションで1回だけ行い、各テストで共有する）
 # ---------------------------------------------------------------------------
 
-def test_load_shelters_from_csv(tmp_path):
-    """正常なCSVから避難所が読み込まれる"""
-    rows = [
+@pytest.fixture(scope="session")
+def two_rows_service(tmp_path_factory):
+    """正常な2行のCSVから構築したサービス"""
+    return _service_from_rows(tmp_path_factory, "two_rows", [
         {
             "施設名": "テスト避難所A",
             "住所": "東京都千代田区1-1",
@@ -71,26 +73,13 @@ def test_load_shelters_from_csv(tmp_path):
             "地震": "1",
             "津波": "1",
         },
-    ]
-    service = _make_service(tmp_path, csv_rows=rows)
-    shelters = service.get_all_shelters()
-    assert len(shelters) == 2
-    assert shelters[0].name == "テスト避難所A"
-    assert shelters[1].name == "テスト避難所B"
+    ])
 
 
-def test_load_shelters_from_csv_missing_file(tmp_path):
-    """CSVファイルが存在しない場合にサンプルデータへフォールバック"""
-    service = _make_service(tmp_path, csv_path="/nonexistent/path.csv")
-    shelters = service.get_all_shelters()
-    # サンプルデータ（ハードコード）にフォールバック
-    assert len(shelters) > 0
-    assert shelters[0].name == "東京都庁"
-
-
-def test_load_shelters_from_csv_invalid_row(tmp_path):
-    """不正行（緯度なし）がスキップされる"""
-    rows = [
+@pytest.fixture(scope="session")
+def invalid_row_service(tmp_path_factory):
+    """不正行（緯度なし）を含むCSVから構築したサービス"""
+    return _service_from_rows(tmp_path_factory, "invalid_row", [
         {
             "施設名": "正常避難所",
             "住所": "東京都新宿区",
@@ -105,20 +94,13 @@ def test_load_shelters_from_csv_invalid_row(tmp_path):
             "経度": "139.7000",
             "地震": "1",
         },
-    ]
-    service = _make_service(tmp_path, csv_rows=rows)
-    shelters = service.get_all_shelters()
-    assert len(shelters) == 1
-    assert shelters[0].name == "正常避難所"
+    ])
 
 
-# ---------------------------------------------------------------------------
-# get_nearby_shelters
-# ---------------------------------------------------------------------------
-
-def test_get_nearby_shelters(tmp_path):
-    """近隣避難所が距離順にソートされて返る"""
-    rows = [
+@pytest.fixture(scope="session")
+def nearby_service(tmp_path_factory):
+    """距離の異なる2か所の避難所を持つサービス"""
+    return _service_from_rows(tmp_path_factory, "nearby", [
         {
             "施設名": "近い避難所",
             "住所": "東京都新宿区",
@@ -133,11 +115,71 @@ def test_get_nearby_shelters(tmp_path):
             "経度": "139.3200",
             "地震": "1",
         },
+    ])
+
+
+@pytest.fixture(scope="session")
+def sample_service(tmp_path_factory):
+    """CSV/JSONがなくハードコードサンプルにフォールバックしたサービス"""
+    return _build_service(tmp_path_factory.mktemp("sample") / "shelters", "")
+
+
+# ---------------------------------------------------------------------------
+# CSV 読み込み
+# ---------------------------------------------------------------------------
+
+def test_load_shelters_from_csv(two_rows_service):
+    """正常なCSVから避難所が読み込まれる"""
+    shelters = two_rows_service.get_all_shelters()
+    assert len(shelters) == 2
+    assert shelters[0].name == "テスト避難所A"
+    assert shelters[1].name == "テスト避難所B"
+
+
+def test_load_shelters_from_csv_missing_file(tmp_path):
+    """CSVファイルが存在しない場合にサンプルデータへフォールバック"""
+    service = _build_service(tmp_path / "shelters", "/nonexistent/path.csv")
+    shelters = service.get_all_shelters()
+    # サンプルデータ（ハードコード）にフォールバック
+    assert len(shelters) > 0
+    assert shelters[0].name == "東京都庁"
+
+
+def test_load_shelters_from_csv_invalid_row(invalid_row_service):
+    """不正行（緯度なし）がスキップされる"""
+    shelters = invalid_row_service.get_all_shelters()
+    assert len(shelters) == 1
+    assert shelters[0].name == "正常避難所"
+
+
+def test_load_shelters_from_csv_alternate_columns(tmp_path):
+    """名称/所在地の列名・災害種別の別名列・列の足りない行を扱える"""
+    csv_file = tmp_path / "shelters.csv"
+    csv_file.write_text(
+        "名称,所在地,緯度,経度,大規模な火事,火災,津波\n"
+        "避難所A,東京都,35.68,139.76,○,1,yes\n"
+        "避難所B,東京都,35.70,139.70\n"
+        "\n"
+        "避難所C,東京都,不正,139.70,1\n",
+        encoding="utf-8",
+    )
+    service = _build_service(tmp_path / "shelters", str(csv_file))
+    shelters = service.get_all_shelters()
+
+    assert [(s.name, s.address, s.types) for s in shelters] == [
+        ("避難所A", "東京都", ["tsunami", "fire"]),
+        ("避難所B", "東京都", []),
     ]
-    service = _make_service(tmp_path, csv_rows=rows)
 
+
+# ---------------------------------------------------------------------------
+# get_nearby_shelters
+# ---------------------------------------------------------------------------
+
+def test_get_nearby_shelters(nearby_service):
+    """近隣避難所が距離順にソートされて返る"""
     # 新宿区付近から検索（半径50kmに広げて両方含める）
-    nearby = service.get_nearby_shelters(lat=35.6896, lon=139.6917, radius_km=50.0)
+    nearby = nearby_service.get_nearby_shelters(lat=35.6896, lon=139.6917, radius_km=50.0)
     assert len(nearby) == 2
     # 近い順にソートされている
     assert nearby[0].name == "近い避難所"
@@ -151,11 +193,83 @@ def test_get_nearby_shelters(tmp_path):
 # サンプルデータフォールバック
 # ---------------------------------------------------------------------------
 
-def test_get_sample_shelters_fallback(tmp_path):
+def test_get_sample_shelters_fallback(sample_service):
     """CSV/JSONがない場合にハードコードサンプルが返る"""
-    service = _make_service(tmp_path, csv_path="")
-    shelters = service.get_all_shelters()
+    shelters = sample_service.get_all_shelters()
     assert len(shelters) == 5
     names = [s.name for s in shelters]
     assert "東京都庁" in names
     assert "代々木公園" in names
+
+
+def test_get_nearby_shelters_matches_haversine(sample_service):
+    """事前計算した座標配列での距離が Haversine 公式の1件ずつの計算と一致する"""
+    lat, lon = 35.6812, 139.7671  # 東京駅
+    nearby = sample_service.get_nearby_shelters(lat=lat, lon=lon, radius_km=10.0, limit=3)
+
+    expected = sorted(
+        (round(sample_service._calculate_distance(lat, lon, s.latitude, s.longitude), 2), s.name)
+        for s in sample_service.get_all_shelters()
+    )[:3]
+    assert [(s.distance, s.name) for s in nearby] == expected
+    # 返り値はコピーで、共有データに距離は書き込まれない
+    assert all(s.distance is None for s in sample_service.get_all_shelters())
+
+
+@pytest.fixture(scope="session")
+def grid_service(tmp_path_factory):
+    """緯度・経度を格子状にずらした多数の避難所を持つサービス"""
+    rows = [
+        {
+            "施設名": f"避難所{i}-{j}",
+            "住所": "",
+            "緯度": f"{35.0 + i * 0.05:.4f}",
+            "経度": f"{139.0 + j * 0.05:.4f}",
+            "地震": "1",
+            "津波": str(j % 2),
+        }
+        for i in range(20) for j in range(20)
+    ]
+    return _service_from_rows(tmp_path_factory, "grid", rows)
+
+
+@pytest.mark.parametrize("radius_km", [0.5, 5.0, 30.0, 200.0])
+@pytest.mark.parametrize("disaster_type", [None, "tsunami"])
+def test_get_nearby_shelters_latitude_index_matches_full_scan(grid_service, radius_km, disaster_type):
+    """緯度の二分探索で絞った結果が全件走査と一致する"""
+    lat, lon = 35.48, 139.52
+    nearby = grid_service.get_nearby_shelters(
+        lat=lat, lon=lon, radius_km=radius_km, disaster_type=disaster_type, limit=1000
+    )
+
+    expected = []
+    for s in grid_service.get_all_shelters(limit=1000):
+        distance = grid_service._calculate_distance(lat, lon, s.latitude, s.longitude)
+        if distance <= radius_km and (disaster_type is None or disaster_type in s.types):
+            expected.append((round(distance, 2), s.name))
+    assert sorted((s.distance, s.name) for s in nearby) == sorted(expected)
+    assert [s.distance for s in nearby] == sorted(s.distance for s in nearby)
+
+
+def test_get_shelters_by_type_matches_types(grid_service):
+    """災害種別のビットマスクでの絞り込みが ShelterInfo.types と一致する"""
+    all_shelters = grid_service.get_all_shelters(limit=1000)
+    expected = [s for s in all_shelters if "tsunami" in s.types]
+    assert grid_service.get_shelters_by_type("tsunami", limit=1000) == expected
+    assert grid_service.get_shelters_by_type("tsunami") == expected[:50]
+    assert grid_service.get_shelters_by_type("volcano") == []
+
+
+def test_get_shelters_by_unlisted_type(tmp_path):
+    """DISASTER_TYPES にない種別もJSONデータの types から絞り込める"""
+    data_dir = tmp_path / "shelters"
+    data_dir.mkdir()
+    (data_dir / "sample_shelters.json").write_text(json.dumps([
+        {"id": "a", "name": "A", "address": "", "latitude": 35.0, "longitude": 139.0, "types": ["heat"]},
+        {"id": "b", "name": "B", "address": "", "latitude": 35.1, "longitude": 139.1, "types": ["fire"]},
+    ]), encoding="utf-8")
+    service = _build_service(data_dir, "")
+
+    assert [s.id for s in service.get_shelters_by_type("heat")] == ["a"]
+    assert [s.id for s in service.get_nearby_shelters(35.0, 139.0, radius_km=50, disaster_type="heat")] == ["a"]
+    assert [s.id for s in service.get_nearby_shelters(35.0, 139.0, radius_km=50, disaster_type="fire")] == ["b"]
@@ -3,11 +3,12 @@ TranslationCache のユニットテスト
 
 DB永続化版: L1インメモリdict + L2 SQLAlchemy DB
 """
+import asyncio
 import hashlib
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.database import Base
@@ -32,10 +33,17 @@ async def db_session():
     await engine.dispose()
 
 
-@pytest.fixture
-def cache():
-    """TranslationCache インスタンス（DB未接続）"""
-    return TranslationCache()
+@pytest_asyncio.fixture
+async def cache():
+    """TranslationCache インスタンス（DB未接続）
+
+    set() が予約する遅延書き込みはテスト終了時に取り消し、DBへは書き込ませない。
+    DBへの書き込みを検証するテストだけが db_session と flush() を使う。
+    """
+    cache = TranslationCache()
+    yield cache
+    if cache._flush_task is not None:
+        cache._flush_task.cancel()
 
 
 # ---------------------------------------------------------------------------
@@ -52,6 +60,17 @@ def test_cache_make_key():
     assert result == expected
 
 
+def test_cache_make_key_memoized():
+    """同じ入力の make_key はメモ化され再計算されない"""
+    TranslationCache.make_key.cache_clear()
+
+    first = TranslationCache.make_key("石川県能登地方", "en")
+    second = TranslationCache.make_key("石川県能登地方", "en")
+
+    assert first == second
+    assert TranslationCache.make_key.cache_info().hits == 1
+
+
 # ---------------------------------------------------------------------------
 # get / contains（同期・インメモリ）
 # ---------------------------------------------------------------------------
@@ -71,13 +90,8 @@ def test_cache_contains_empty(cache):
 # ---------------------------------------------------------------------------
 
 @pytest.mark.asyncio
-async def test_cache_set_and_get(cache, db_session, monkeypatch):
-    """set() でインメモリdictに保存され、get() で取得できる"""
-    monkeypatch.setattr("app.services.translation_cache.async_session", db_session, raising=False)
-    # async_session はモジュールレベルのインポートではなく関数内インポートなので
-    # database モジュール側をパッチする
-    monkeypatch.setattr("app.database.async_session", db_session)
-
+async def test_cache_set_and_get(cache):
+    """set() でインメモリdictに保存され、get() で取得できる（DBへの書き込みは遅延）"""
     await cache.set("key1", "value1")
 
     # インメモリから取得
@@ -87,10 +101,11 @@ async def test_cache_set_and_get(cache, db_session, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_cache_set_writes_to_db(cache, db_session, monkeypatch):
-    """set() でDBにも書き込まれる"""
+    """set() した値は flush() でDBにも書き込まれる"""
     monkeypatch.setattr("app.database.async_session", db_session)
 
     await cache.set("db_key", "db_value")
+    await cache.flush()
 
     # DBから直接確認
     async with db_session() as session:
@@ -108,7 +123,9 @@ async def test_cache_set_upsert(cache, db_session, monkeypatch):
     monkeypatch.setattr("app.database.async_session", db_session)
 
     await cache.set("upsert_key", "old_value")
+    await cache.flush()
     await cache.set("upsert_key", "new_value")
+    await cache.flush()
 
     # インメモリ
     assert cache.get("upsert_key") == "new_value"
@@ -123,6 +140,95 @@ async def test_cache_set_upsert(cache, db_session, monkeypatch):
         assert row.value == "new_value"
 
 
+@pytest.mark.asyncio
+async def test_cache_set_coalesces_db_writes(cache, db_session, monkeypatch):
+    """set() はDBへ即時書き込まず、FLUSH_INTERVAL 後にまとめて書き込む"""
+    monkeypatch.setattr("app.database.async_session", db_session)
+    monkeypatch.setattr(TranslationCache, "FLUSH_INTERVAL", 0.01)
+
+    await cache.set("k1", "v1")
+    await cache.set("k2", "v2")
+    # 遅延書き込みタスクは1つだけ
+    task = cache._flush_task
+    assert task is not None and not task.done()
+
+    await task
+
+    async with db_session() as session:
+        result = await session.execute(select(TranslationCacheRow))
+        assert {row.cache_key: row.value for row in result.scalars()} == {"k1": "v1", "k2": "v2"}
+    assert cache._dirty == set()
+
+
+@pytest.mark.asyncio
+async def test_cache_many_sets_flush_in_one_transaction(cache, db_session, monkeypatch):
+    """短時間の大量の set() は1回のDBセッションにまとめて書き込まれる"""
+    opened = 0
+
+    def counting_session():
+        nonlocal opened
+        opened += 1
+        return db_session()
+
+    monkeypatch.setattr("app.database.async_session", counting_session)
+    monkeypatch.setattr(TranslationCache, "FLUSH_INTERVAL", 0.01)
+
+    for i in range(1000):
+        await cache.set(f"k{i}", f"v{i}")
+    await cache._flush_task
+
+    assert opened == 1
+    async with db_session() as session:
+        assert await session.scalar(select(func.count()).select_from(TranslationCacheRow)) == 1000
+
+
+@pytest.mark.asyncio
+async def test_cache_cancelled_flush_keeps_dirty_keys(cache, db_session, monkeypatch):
+    """書き込み中に取り消された flush の未保存分は、close() で書き出される"""
+    monkeypatch.setattr("app.database.async_session", db_session)
+    await cache.set("cancel_key", "cancel_value")
+    cache._flush_task.cancel()
+
+    started = asyncio.Event()
+    original_session = db_session
+
+    class _BlockingSession:
+        async def __aenter__(self):
+            started.set()
+            await asyncio.sleep(3600)
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr("app.database.async_session", _BlockingSession)
+    cache._flush_task = asyncio.create_task(cache.flush())
+    await started.wait()
+
+    monkeypatch.setattr("app.database.async_session", original_session)
+    await cache.close()
+
+    async with db_session() as session:
+        result = await session.execute(
+            select(TranslationCacheRow).where(TranslationCacheRow.cache_key == "cancel_key")
+        )
+        assert result.scalar_one().value == "cancel_value"
+
+
+@pytest.mark.asyncio
+async def test_cache_close_flushes_pending(cache, db_session, monkeypatch):
+    """close() は遅延書き込みを待たずに未保存分を書き出す"""
+    monkeypatch.setattr("app.database.async_session", db_session)
+
+    await cache.set("pending_key", "pending_value")
+    await cache.close()
+
+    async with db_session() as session:
+        result = await session.execute(
+            select(TranslationCacheRow).where(TranslationCacheRow.cache_key == "pending_key")
+        )
+        assert result.scalar_one().value == "pending_value"
+
+
 # ---------------------------------------------------------------------------
 # init（DBからの復元）
 # ---------------------------------------------------------------------------
@@ -167,9 +273,88 @@ async def test_cache_set_db_failure_keeps_inmemory(cache, monkeypatch):
     monkeypatch.setattr("app.database.async_session", broken_session)
 
     await cache.set("fallback_key", "fallback_value")
+    await cache.flush()
 
-    # インメモリには保存されている
+    # インメモリには保存されており、次回の書き込みで再試行される
     assert cache.get("fallback_key") == "fallback_value"
+    assert cache._dirty == {"fallback_key"}
+
+
+@pytest.mark.asyncio
+async def test_cache_set_during_flush_is_written_without_another_set(cache, db_session, monkeypatch):
+    """書き込み中に set() されたキーも、次の set() を待たずに書き込まれる"""
+    monkeypatch.setattr(TranslationCache, "FLUSH_INTERVAL", 0.01)
+    entered = asyncio.Event()
+    release = asyncio.Event()
+
+    class _SlowSession:
+        def __init__(self):
+            self._session = db_session()
+
+        async def __aenter__(self):
+            entered.set()
+            await release.wait()
+            return await self._session.__aenter__()
+
+        async def __aexit__(self, *exc):
+            return await self._session.__aexit__(*exc)
+
+    monkeypatch.setattr("app.database.async_session", _SlowSession)
+
+    await cache.set("k1", "v1")
+    task = cache._flush_task
+    await entered.wait()
+    # 書き込み中（タスク実行中）の set() は新しいタスクを作らない
+    await cache.set("k2", "v2")
+    assert cache._flush_task is task
+    release.set()
+    await task
+
+    async with db_session() as session:
+        result = await session.execute(select(TranslationCacheRow))
+        assert {row.cache_key: row.value for row in result.scalars()} == {"k1": "v1", "k2": "v2"}
+    assert cache._dirty == set()
+
+
+@pytest.mark.asyncio
+async def test_cache_failed_flush_is_retried_with_backoff(cache, db_session, monkeypatch):
+    """書き込みに失敗したキーは、間隔を倍にしながら自動で再試行される"""
+    monkeypatch.setattr(TranslationCache, "FLUSH_INTERVAL", 0.01)
+    failures = 2
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    class _FlakySession:
+        def __init__(self):
+            self._session = db_session()
+
+        async def __aenter__(self):
+            nonlocal failures
+            if failures:
+                failures -= 1
+                raise RuntimeError("DB connection failed")
+            return await self._session.__aenter__()
+
+        async def __aexit__(self, *exc):
+            return await self._session.__aexit__(*exc)
+
+    monkeypatch.setattr("app.database.async_session", _FlakySession)
+    monkeypatch.setattr("app.services.translation_cache.asyncio.sleep", recording_sleep)
+
+    await cache.set("retry_key", "retry_value")
+    await cache._flush_task
+
+    assert delays == [0.01, 0.02, 0.04]
+    assert cache._dirty == set()
+    async with db_session() as session:
+        result = await session.execute(
+            select(TranslationCacheRow).where(TranslationCacheRow.cache_key == "retry_key")
+        )
+        assert result.scalar_one().value == "retry_value"
 
 
 @pytest.mark.asyncio
@@ -191,3 +376,139 @@ async def test_cache_init_db_failure_keeps_empty(monkeypatch):
 
     assert cache.get("anything") is None
     assert cache.contains("anything") is False
+
+
+# ---------------------------------------------------------------------------
+# get_json / set_json（デコード済みオブジェクトの保持）
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_cache_set_json_and_get_json(cache):
+    """set_json() した dict が get_json() でコピーとして返り、値はJSON文字列で保存される"""
+    await cache.set_json("json_key", {"name": "大雨警報", "action": ""})
+
+    first = cache.get_json("json_key")
+    assert first == {"name": "大雨警報", "action": ""}
+    first["cached"] = True
+    # 返り値の書き換えはキャッシュに波及しない
+    assert "cached" not in cache.get_json("json_key")
+    assert cache.get("json_key") == '{"name":"大雨警報","action":""}'
+
+
+def test_cache_get_json_decodes_once(cache, monkeypatch):
+    """DB復元済みの文字列は初回のみデコードされる"""
+    cache._cache["restored"] = '{"title": "Earthquake"}'
+
+    assert cache.get_json("restored") == {"title": "Earthquake"}
+    monkeypatch.setattr(
+        "app.services.translation_cache.orjson.loads",
+        lambda raw: pytest.fail("orjson.loads should not be called on a decoded hit"),
+    )
+    assert cache.get_json("restored") == {"title": "Earthquake"}
+    assert cache.get_json("missing") is None
+
+
+def test_cache_get_json_invalid_returns_none(cache):
+    """JSONとして不正な値・dict 以外の値は None を返す"""
+    cache._cache["broken"] = "not json"
+    cache._cache["list"] = "[1, 2]"
+
+    assert cache.get_json("broken") is None
+    assert cache.get_json("list") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_get_or_load_coalesces_concurrent_misses(cache):
+    """同じキーへの同時ミスは loader 1回にまとまり、結果はキャッシュされる"""
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "Tokyo"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+    assert results == ["Tokyo"] * 5
+    assert calls == 1
+    assert await cache.get_or_load("k", loader) == "Tokyo"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_get_or_load_does_not_cache_failures(cache):
+    """loader の例外は送出され、空の結果はキャッシュされない"""
+    async def failing():
+        raise RuntimeError("rate limited")
+
+    async def empty():
+        return None
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("k", failing)
+    assert await cache.get_or_load("k", empty) is None
+    assert not cache.contains("k")
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_get_or_load_json_returns_copies(cache):
+    """get_or_load_json は loader の dict を保存し、呼び出し毎にコピーを返す"""
+
+    async def loader():
+        return {"name": "Heavy Rain Warning"}
+
+    first = await cache.get_or_load_json("w", loader)
+    first["cached"] = True
+    assert await cache.get_or_load_json("w", loader) == {"name": "Heavy Rain Warning"}
+
+
+@pytest.mark.asyncio
+async def test_cache_get_or_load_leader_cancel_does_not_cancel_waiters(cache):
+    """先に取得していたタスクが取り消されても、待機中の呼び出しは自分で取得し直す"""
+    started = asyncio.Event()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(3600)
+        return "Tokyo"
+
+    leader = asyncio.create_task(cache.get_or_load("k", loader))
+    await started.wait()
+    waiters = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    # 待機者のうち1つが取得を引き継ぎ、残りはその結果を共有する
+    assert await asyncio.gather(*waiters) == ["Tokyo"] * 3
+    assert calls == 2
+    assert cache.get("k") == "Tokyo"
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_get_or_load_cancelled_waiter_raises(cache):
+    """取り消された待機者自身には CancelledError が届き、先行の取得は続く"""
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return "Tokyo"
+
+    leader = asyncio.create_task(cache.get_or_load("k", loader))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_load("k", loader))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    assert await leader == "Tokyo"
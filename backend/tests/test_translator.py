@@ -3,8 +3,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from app.services.translator import TranslatorService
 
 
-@pytest.fixture
-def mock_settings():
+@pytest.fixture(scope="session")
+def shared_translator():
+    """セッションで1回だけ構築する TranslatorService
+
+    設定を読むのは __init__ だけなので、app.config.settings のパッチは構築中に限る
+    （セッション全体でパッチすると他モジュールのテストに波及する）。
+    """
     with patch("app.config.settings") as mock:
         mock.anthropic_api_key = "test_key"
         mock.gemini_api_key = "test_key"
@@ -15,12 +20,37 @@ def mock_settings():
         mock.api_timeout = 10.0
         mock.ai_timeout_translate = 10.0
         mock.ai_timeout_generate = 30.0
-        yield mock
+        mock.ai_max_concurrency = 8
+        return TranslatorService()
+
+
+def _snapshot(obj) -> dict:
+    """インスタンス属性と、その中の dict / set のコピーを取る"""
+    return {
+        name: value.copy() if isinstance(value, (dict, set)) else value
+        for name, value in vars(obj).items()
+    }
+
+
+def _restore(obj, snapshot: dict) -> None:
+    """_snapshot の状態に戻す（テスト中に差し替えた属性・追加したキーを消す）"""
+    vars(obj).clear()
+    vars(obj).update(
+        {
+            name: value.copy() if isinstance(value, (dict, set)) else value
+            for name, value in snapshot.items()
+        }
+    )
 
 
 @pytest.fixture
-def translator(mock_settings):
-    return TranslatorService()
+def translator(shared_translator):
+    """共有の TranslatorService（テストごとにキャッシュ・差し替えたメソッドを元に戻す）"""
+    parts = (shared_translator, shared_translator._ai, shared_translator._cache)
+    snapshots = [_snapshot(part) for part in parts]
+    yield shared_translator
+    for part, snapshot in zip(parts, snapshots):
+        _restore(part, snapshot)
 
 
 @pytest.mark.asyncio
@@ -38,6 +68,30 @@ async def test_translate_location_no_change(translator):
     assert result == "東京"
 
 
+@pytest.mark.asyncio
+async def test_translate_location_static_skips_cache_and_ai(translator):
+    """静的マッピングにある地名はキャッシュ・AIを経由せず、部分一致では置換しないテスト"""
+    translator._ai.translate_text = AsyncMock(return_value=None)
+    translator._cache.get = MagicMock(return_value=None)
+
+    assert await translator.translate_location("北海道北西沖", "ko") == "홋카이도 북서쪽 앞바다"
+    translator._cache.get.assert_not_called()
+    translator._ai.translate_text.assert_not_called()
+
+    # 地名を含むだけの文字列は静的マッピングの対象外
+    assert await translator.translate_location("北海道北西沖付近", "ko") == "北海道北西沖付近"
+
+
+@pytest.mark.asyncio
+async def test_translate_location_ascii_passthrough(translator):
+    """英語指定でASCIIのみの地名はキャッシュ・AIを経由せずそのまま返るテスト"""
+    translator._ai.translate_text = AsyncMock()
+
+    result = await translator.translate_location("Tokyo Bay", "en")
+    assert result == "Tokyo Bay"
+    translator._ai.translate_text.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_translate_cache_hit(translator):
     """キャッシュヒットのテスト"""
@@ -53,6 +107,17 @@ async def test_translate_cache_hit(translator):
     translator._translate_with_ai.assert_not_called()
 
 
+def test_get_cache_key_memoized(translator):
+    """_get_cache_key は TranslationCache.make_key のメモ化を共有するテスト"""
+    from app.services.translation_cache import TranslationCache
+
+    TranslatorService._get_cache_key.cache_clear()
+    key = translator._get_cache_key("石川県能登地方", "en")
+    assert TranslatorService._get_cache_key("石川県能登地方", "en") == key
+    assert key == TranslationCache.make_key("石川県能登地方", "en")
+    assert TranslatorService._get_cache_key.cache_info().hits >= 2
+
+
 @pytest.mark.asyncio
 async def test_template_translation(translator):
     """テンプレート翻訳のテスト"""
@@ -84,6 +149,19 @@ def test_template_translation_no_keyword_false_positive(translator):
     )
 
 
+def test_template_translation_index_covers_templates(translator):
+    """プレースホルダーのない定型文はすべて索引から完全一致で引けるテスト"""
+    from app.services.translation_templates import TEMPLATES
+
+    for translations in TEMPLATES.values():
+        ja_template = translations.get("ja", "")
+        if not ja_template or "{" in ja_template:
+            continue
+        assert translator._try_template_translation(ja_template, "en") == translations.get("en")
+        # 前後に文字が付いた文は対象外
+        assert translator._try_template_translation(ja_template + "。", "en") is None
+
+
 @pytest.mark.asyncio
 async def test_translate_uses_cache_without_provider():
     """AIプロバイダー未設定でもDB復元済みキャッシュから翻訳が返るテスト"""
@@ -97,6 +175,7 @@ async def test_translate_uses_cache_without_provider():
         mock.api_timeout = 10.0
         mock.ai_timeout_translate = 10.0
         mock.ai_timeout_generate = 30.0
+        mock.ai_max_concurrency = 8
         no_provider_translator = TranslatorService()
 
     cache_key = no_provider_translator._get_cache_key("曇りのち晴れ", "en")
@@ -112,3 +191,99 @@ def test_get_supported_languages(translator):
     assert "ja" in langs
     assert "en" in langs
     assert len(langs) >= 15
+
+
+def test_generate_earthquake_message(translator):
+    """地震メッセージが言語別テンプレートで組み立てられるテスト"""
+    kwargs = dict(
+        location="Tokyo Bay",
+        magnitude=4.5,
+        intensity="3",
+        depth=40,
+        tsunami_warning="なし",
+        tsunami_warning_translated="None",
+    )
+    message = translator.generate_earthquake_message("en", **kwargs)
+    assert message == (
+        "[Earthquake] An earthquake occurred in Tokyo Bay. Magnitude 4.5, "
+        "Maximum intensity 3. Depth: 40km. There is no tsunami risk from this earthquake."
+    )
+    # 未対応の言語は英語テンプレートにフォールバックする
+    assert translator.generate_earthquake_message("xx", **kwargs) == message
+
+    kwargs.update(tsunami_warning="津波注意報", tsunami_warning_translated="Tsunami Advisory")
+    message = translator.generate_earthquake_message("ko", **kwargs)
+    assert message.startswith("【지진정보】Tokyo Bay에서")
+    assert message.endswith("쓰나미 정보: Tsunami Advisory.")
+
+
+@pytest.mark.asyncio
+async def test_translate_location_negative_cache(translator, monkeypatch):
+    """AI翻訳に失敗した地名はTTL内に再試行されないテスト"""
+    translator._ai.translate_text = AsyncMock(return_value=None)
+
+    assert await translator.translate_location("未知の海域", "en") == "未知の海域"
+    assert await translator.translate_location("未知の海域", "en") == "未知の海域"
+    assert translator._ai.translate_text.await_count == 1
+
+    # TTL 経過後は再び AI に問い合わせる
+    expired = translator._neg_cache[("未知の海域", "en")] + 1
+    monkeypatch.setattr("app.services.translator.time.monotonic", lambda: expired)
+    await translator.translate_location("未知の海域", "en")
+    assert translator._ai.translate_text.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_location_negative_cache_is_bounded(translator, monkeypatch):
+    """失敗した地名が増え続けてもネガティブキャッシュは期限切れ・上限超過分が捨てられるテスト"""
+    translator._ai.translate_text = AsyncMock(return_value=None)
+    monkeypatch.setattr(translator, "NEGATIVE_CACHE_MAX", 3)
+    now = 1000.0
+    monkeypatch.setattr("app.services.translator.time.monotonic", lambda: now)
+
+    for i in range(5):
+        await translator.translate_location(f"未知の海域{i}", "en")
+    assert list(translator._neg_cache) == [(f"未知の海域{i}", "en") for i in (2, 3, 4)]
+
+    # 記録時に期限切れのエントリも捨てる
+    now += translator.NEGATIVE_CACHE_TTL
+    await translator.translate_location("別の海域", "en")
+    assert list(translator._neg_cache) == [("別の海域", "en")]
+
+
+def test_get_default_action_ja_on_class():
+    """デフォルト推奨行動はインスタンスなしでクラスから引けるテスト"""
+    assert TranslatorService._get_default_action_ja("extreme").startswith("直ちに安全な場所へ避難")
+    assert TranslatorService._get_default_action_ja("unknown") == TranslatorService._get_default_action_ja("medium")
+
+
+@pytest.mark.asyncio
+async def test_generate_warning_text_multi(translator):
+    """複数言語の警報テキストが並列生成され、失敗した言語は除外されるテスト"""
+    async def fake_generate(warning_name_ja, target_lang, area_name=None, severity="medium"):
+        if target_lang == "th":
+            raise RuntimeError("rate limited")
+        return {"name": f"{warning_name_ja}:{target_lang}", "description": "", "action": ""}
+
+    translator.generate_warning_text = fake_generate
+
+    results = await translator.generate_warning_text_multi("大雨警報", ["ja", "en", "th"])
+    assert set(results) == {"ja", "en"}
+    assert results["en"]["name"] == "大雨警報:en"
+
+
+@pytest.mark.asyncio
+async def test_generate_safety_guide_multi(translator):
+    """複数言語の安全ガイドが言語コードをキーにまとめて返るテスト"""
+    translator._ai.get_active_provider = MagicMock(return_value=None)
+
+    results = await translator.generate_safety_guide_multi("earthquake", ["en", "ko"])
+    assert set(results) == {"en", "ko"}
+    assert results["ko"]["lang"] == "ko"
+
+
+def test_get_disaster_type_name(translator):
+    """災害種別名が平坦な索引から引けて、未知の種別・言語はそのまま返るテスト"""
+    assert translator.get_disaster_type_name("earthquake", "en") == "Earthquake"
+    assert translator.get_disaster_type_name("earthquake", "xx") == "earthquake"
+    assert translator.get_disaster_type_name("unknown", "en") == "unknown"
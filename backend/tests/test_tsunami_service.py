@@ -0,0 +1,189 @@
+"""
+TsunamiService のユニットテスト
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.tsunami_service import TsunamiService
+
+
+@pytest.fixture
+def service():
+    """TsunamiService インスタンス（HTTP通信なし）"""
+    return TsunamiService()
+
+
+# ---------------------------------------------------------------------------
+# _determine_warning_level
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "kind_names, expected",
+    [
+        (["大津波警報"], "major_warning"),
+        (["津波警報"], "warning"),
+        (["津波注意報"], "advisory"),
+        (["津波予報（若干の海面変動）", "津波注意報"], "advisory"),
+        (["津波予報（若干の海面変動）"], "none"),
+        ([], "none"),
+    ],
+)
+def test_determine_warning_level(service, kind_names, expected):
+    """種別名から警報レベルが判定され、大津波警報は津波警報と区別される"""
+    kind_list = [{"name": name} for name in kind_names]
+    assert service._determine_warning_level(kind_list) == expected
+
+
+# ---------------------------------------------------------------------------
+# _parse_coordinates
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "coord_str, expected",
+    [
+        ("+40.9+143.0-20000/", (40.9, 143.0)),
+        ("+37.5+137.3/", (37.5, 137.3)),
+        ("+38+142-10000/", (38.0, 142.0)),
+        ("-33.9+151.2-10000/", (-33.9, 151.2)),
+        ("", (None, None)),
+        ("不明", (None, None)),
+    ],
+)
+def test_parse_coordinates(service, coord_str, expected):
+    """緯度・経度が抽出され、深さは無視、不正な形式は (None, None) になる"""
+    assert service._parse_coordinates(coord_str) == expected
+
+
+# ---------------------------------------------------------------------------
+# _generate_message
+# ---------------------------------------------------------------------------
+
+def test_generate_message_by_title(service):
+    """タイトルの警報種別に応じて推奨行動が変わる"""
+    item = {"anm": "三陸沖", "mag": "7.0"}
+
+    warning = service._generate_message({**item, "ttl": "津波警報・注意報・予報a"})
+    assert warning == (
+        "【津波警報・注意報・予報a】三陸沖でマグニチュード7.0の地震が発生しました。"
+        "直ちに高台へ避難してください。"
+    )
+    advisory = service._generate_message({**item, "ttl": "津波注意報"})
+    assert advisory.endswith("海岸から離れてください。")
+    info = service._generate_message({"ttl": "津波情報a"})
+    assert info == "【津波情報】不明でマグニチュード不明の地震が発生しました。津波情報a"
+
+
+def test_classify_title_prefers_highest_level(service):
+    """複数の種別を含むタイトルは上位の警報レベルに分類される"""
+    assert service._classify_title("津波注意報・大津波警報") == "major_warning"
+    assert service._classify_title("津波注意報") == "advisory"
+    assert service._classify_title("津波情報a") == "none"
+
+
+# ---------------------------------------------------------------------------
+# get_tsunami_list
+# ---------------------------------------------------------------------------
+
+_LIST_ITEM = {
+    "ctt": "20240101161000",
+    "eid": "20240101161010",
+    "ttl": "大津波警報・津波警報・津波注意報・津波予報",
+    "rdt": "2024-01-01T16:22:00+09:00",
+    "at": "2024-01-01T16:10:00+09:00",
+    "anm": "石川県能登地方",
+    "mag": "7.6",
+    "cod": "+37.5+137.3-10000/",
+    "kind": [{"name": "大津波警報"}, {"name": "津波警報"}],
+}
+
+
+def _mock_client(service: TsunamiService, handler) -> None:
+    """TsunamiService の HTTP クライアントをモックトランスポートに差し替える"""
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_get_tsunami_list_parses_items(service):
+    """一覧JSONが TsunamiInfo に変換され、limit 件に絞られる"""
+    _mock_client(service, lambda request: httpx.Response(200, json=[_LIST_ITEM, _LIST_ITEM]))
+
+    tsunamis = await service.get_tsunami_list(limit=1)
+
+    assert len(tsunamis) == 1
+    tsunami = tsunamis[0]
+    assert tsunami.event_id == "20240101161010"
+    assert tsunami.warning_level == "major_warning"
+    assert tsunami.areas == _LIST_ITEM["kind"]
+    assert tsunami.message.endswith("直ちに高台へ避難してください。")
+
+
+@pytest.mark.asyncio
+async def test_get_tsunami_list_http_error_returns_empty(service):
+    """取得エラー時は空リストを返す"""
+    _mock_client(service, lambda request: httpx.Response(503))
+
+    assert await service.get_tsunami_list() == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", [
+    lambda request: httpx.Response(503),
+    lambda request: httpx.Response(200, content=b"{broken"),
+])
+async def test_get_tsunami_list_refresh_failure_keeps_last_list(service, monkeypatch, failure):
+    """TTL 経過後の更新に失敗しても、前回取得した一覧を返し続ける"""
+    responses = iter([lambda request: httpx.Response(200, json=[_LIST_ITEM]), failure])
+    _mock_client(service, lambda request: next(responses)(request))
+    await service.get_tsunami_list()
+
+    monkeypatch.setattr(TsunamiService, "LIST_CACHE_TTL", 0.0)
+    tsunamis = await service.get_tsunami_list()
+
+    assert [t.event_id for t in tsunamis] == [_LIST_ITEM["eid"]]
+
+
+@pytest.mark.asyncio
+async def test_get_tsunami_list_cached_within_ttl(service):
+    """TTL 内の同時・連続呼び出しは1回の取得にまとめられ、コピーが返る"""
+    requests: list[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[_LIST_ITEM])
+
+    _mock_client(service, handler)
+
+    first, second = await asyncio.gather(service.get_tsunami_list(), service.get_tsunami_list())
+    assert len(requests) == 1
+    # 呼び出し側での書き換えはキャッシュに波及しない
+    first[0].message_translated = "translated"
+    assert second[0].message_translated is None
+    assert (await service.get_tsunami_list())[0].message_translated is None
+
+
+@pytest.mark.asyncio
+async def test_get_tsunami_list_conditional_get(service, monkeypatch):
+    """TTL 経過後は検証子付きで再取得し、304 ならキャッシュを返す"""
+    requests: list[httpx.Request] = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json=[_LIST_ITEM],
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 07:22:00 GMT"},
+        )
+
+    _mock_client(service, handler)
+    await service.get_tsunami_list()
+
+    monkeypatch.setattr(TsunamiService, "LIST_CACHE_TTL", 0.0)
+    tsunamis = await service.get_tsunami_list()
+
+    assert len(requests) == 2
+    assert requests[1].headers["If-Modified-Since"] == "Mon, 01 Jan 2024 07:22:00 GMT"
+    assert [t.event_id for t in tsunamis] == [_LIST_ITEM["eid"]]
@@ -0,0 +1,102 @@
+"""
+VolcanoService のユニットテスト
+"""
+import httpx
+import pytest
+
+from app.services.volcano_service import VolcanoService
+
+
+@pytest.fixture
+def service():
+    """VolcanoService インスタンス（HTTP通信なし）"""
+    return VolcanoService()
+
+
+def _mock_client(service: VolcanoService, handler) -> None:
+    """VolcanoService の HTTP クライアントをモックトランスポートに差し替える"""
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+# ---------------------------------------------------------------------------
+# get_volcano_warnings
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_get_volcano_warnings_skips_failed_volcanoes(service):
+    """取得に失敗した火山・警報のない火山は除外され、他の火山の警報は返る"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        code = int(request.url.path.rsplit("/", 1)[-1].removesuffix(".json"))
+        if code == 506:  # 桜島
+            return httpx.Response(200, json={"level": 3, "reportDatetime": "2024-01-01T00:00:00+09:00"})
+        if code == 314:  # 富士山
+            raise httpx.ConnectError("connection refused")
+        return httpx.Response(404)
+
+    _mock_client(service, handler)
+
+    warnings = await service.get_volcano_warnings()
+
+    assert [w["volcano_code"] for w in warnings] == [506]
+    assert warnings[0]["alert_level_name"] == "入山規制"
+    assert warnings[0]["severity"] == "high"
+
+
+# ---------------------------------------------------------------------------
+# get_volcano_list / get_volcano_by_code
+# ---------------------------------------------------------------------------
+
+_VOLCANO_LIST = [
+    {"code": 314, "name_jp": "富士山", "name_en": "Fujisan", "latlon": [35.36, 138.73]},
+    {"code": 999, "name_jp": "架空山", "latlon": [30.0, 130.0], "levelOperation": True},
+]
+
+
+@pytest.mark.asyncio
+async def test_get_volcano_by_code_uses_cached_index(service, monkeypatch):
+    """火山一覧は1回だけ取得・パースされ、コード検索は索引から引かれる"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_VOLCANO_LIST)
+
+    _mock_client(service, handler)
+    parse = service._parse_volcano_list
+    parsed = []
+    monkeypatch.setattr(service, "_parse_volcano_list", lambda data: parsed.append(data) or parse(data))
+
+    fuji = await service.get_volcano_by_code(314)
+    assert fuji.name == "富士山" and fuji.is_monitored
+    assert (await service.get_volcano_by_code(999)).is_monitored
+    assert await service.get_volcano_by_code(1) is None
+    assert [v.code for v in await service.get_volcano_list()] == [314, 999]
+
+    assert len(requests) == 1
+    assert len(parsed) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_volcano_by_code_fetch_error_returns_none(service):
+    """火山一覧の取得に失敗したら None・空リストを返す"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    _mock_client(service, handler)
+
+    assert await service.get_volcano_by_code(314) is None
+    assert await service.get_volcano_list() == []
+
+
+@pytest.mark.asyncio
+async def test_get_volcano_list_not_found_is_not_cached(service):
+    """火山一覧の 404 はキャッシュせず、次の呼び出しで取り直す"""
+    responses = [httpx.Response(404), httpx.Response(200, json=_VOLCANO_LIST)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    _mock_client(service, handler)
+
+    assert await service.get_volcano_list() == []
+    assert [v.code for v in await service.get_volcano_list()] == [314, 999]
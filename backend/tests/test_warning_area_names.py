@@ -15,6 +15,8 @@
 3 が厄介で、既存テストは `_parse_warnings` を直接呼んでいたため、
 本番が通らない経路を検証して緑になっていた。
 """
+import httpx
+import orjson
 import pytest
 
 from app.models import ALLOWED_LANGUAGES
@@ -68,11 +70,12 @@ class TestAllLanguagesUseStaticPath:
         service = WarningService()
 
         class _FakeResponse:
+            status_code = 200
+
             def raise_for_status(self):
                 return None
 
-            def json(self):
-                return _payload("130010")
+            content = orjson.dumps(_payload("130010"))
 
         class _FakeClient:
             async def get(self, url, timeout=None):
@@ -220,6 +223,28 @@ class TestMultipleForecastOffices:
         service = self._service_with_fake_fetch(monkeypatch, {})
         assert await service.get_warnings("471000", "en") == []
 
+    async def test_存在しない予報区の404はエラーを記録しキャッシュしない(self, monkeypatch):
+        """404 を「警報なし」として黙って握りつぶさない（予報区コードの誤りに気づけるように）。"""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(404)
+
+        service = WarningService()
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        logged: list[tuple] = []
+        monkeypatch.setattr(
+            "app.services.warning_service.logger.error", lambda *args, **kwargs: logged.append(args)
+        )
+
+        assert await service._fetch_warning_payload("999999") is None
+        assert await service._fetch_warning_payload("999999") is None
+
+        assert len(requests) == 2
+        assert [args[1] for args in logged] == ["999999", "999999"]
+        await service.close()
+
     async def test_単一予報区の県では取得回数が1回(self, monkeypatch):
         requested: list[str] = []
         service = WarningService()
@@ -233,6 +258,54 @@ class TestMultipleForecastOffices:
 
         assert requested == ["130000"]
 
+    async def test_全国取得は全予報区の組み立て済みURLを使う(self, monkeypatch):
+        requested: list[str] = []
+        service = WarningService()
+
+        class _Cache:
+            async def get_json(self, client, url, ttl, timeout=None):
+                requested.append(url)
+                return None
+
+        service._json_cache = _Cache()
+        assert await service.get_all_prefectures_warnings() == []
+
+        assert len(requested) == 58
+        assert requested == list(service._office_urls.values())
+        assert requested[0].endswith(f"/warning/data/warning/{next(iter(service._office_urls))}.json")
+
+    async def test_全国取得で1予報区のパースが失敗しても他は出る(self, monkeypatch):
+        service = self._service_with_fake_fetch(
+            monkeypatch,
+            {"130000": _payload("130010"), "474000": _payload("474010")},
+        )
+        parse = WarningService._parse_warnings
+
+        def flaky_parse(self, data, area_code, *args, **kwargs):
+            if area_code == "474000":
+                raise KeyError("areas")
+            return parse(self, data, area_code, *args, **kwargs)
+
+        monkeypatch.setattr(WarningService, "_parse_warnings", flaky_parse)
+
+        alerts = await service.get_all_prefectures_warnings()
+        assert [a.id.split("_")[0] for a in alerts] == ["130000"]
+
+    async def test_特別警報のみの取得では他の警報を組み立てない(self, monkeypatch):
+        service = self._service_with_fake_fetch(
+            monkeypatch,
+            {
+                "130000": _payload("130010", warning_code="33"),  # 大雨特別警報
+                "474000": _payload("474010", warning_code="03"),  # 大雨警報
+            },
+        )
+
+        alerts = await service.get_special_warnings()
+        assert [(a.title, a.severity) for a in alerts] == [("大雨特別警報", "extreme")]
+        assert service._parse_warnings(
+            _payload("474010"), "474000", severity_filter=frozenset({"extreme"})
+        ) == []
+
 
 class TestContinuingWarningsAreShown:
     """継続中の警報が消えないこと
@@ -295,6 +368,16 @@ class TestContinuingWarningsAreShown:
         assert len(alerts) == 1
         assert alerts[0].title == "雷注意報"
 
+    async def test_有効な警報が無ければAI経路は翻訳を呼ばない(self, monkeypatch):
+        service = WarningService()
+
+        def _boom(*args, **kwargs):
+            raise AssertionError("有効な警報が無いのに translator を呼んだ")
+
+        monkeypatch.setattr(WarningService, "translator", property(_boom))
+        payload = self._payload_with_status("解除")
+        assert await service._parse_warnings_with_ai(payload, "130000", "th") == []
+
 
 class TestWarningIsNeverLost:
     """地名が引けなくても警報そのものは落とさない"""
@@ -346,3 +429,85 @@ class TestWarningIsNeverLost:
         alerts = service._parse_warnings(payload, "471000", "en")
         assert len(alerts) == 1, "市町村にしか無い警報が消えた"
         assert alerts[0].area == "Okinawa Main Island"
+
+
+class TestAIPathBatching:
+    """AI 経路（`_parse_warnings_with_ai`）の並列化と警報単位のフォールバック"""
+
+    @staticmethod
+    def _payload_multi() -> dict:
+        # 同じ地域に大雨警報（03）と洪水警報（04）
+        return {
+            "reportDatetime": "2026-08-01T12:00:00+09:00",
+            "areaTypes": [
+                {
+                    "areas": [
+                        {
+                            "code": "130010",
+                            "warnings": [
+                                {"code": "03", "status": "発表"},
+                                {"code": "04", "status": "発表"},
+                            ],
+                        }
+                    ]
+                }
+            ],
+        }
+
+    async def test_同じ地域の地名翻訳は1回にまとまり_失敗した警報だけ英語に落ちる(self):
+        location_calls: list[str] = []
+
+        class _FakeTranslator:
+            async def generate_warning_text(self, warning_name_ja, target_lang, area_name=None, severity="medium"):
+                if warning_name_ja == "洪水警報":
+                    raise RuntimeError("rate limited")
+                return {"name": f"{warning_name_ja}:{target_lang}", "description": "d", "action": "a"}
+
+            async def translate_location(self, location, target_lang):
+                location_calls.append(location)
+                return f"{location}:{target_lang}"
+
+        service = WarningService(translator=_FakeTranslator())
+        alerts = await service._parse_warnings_with_ai(self._payload_multi(), "130000", "fr")
+
+        assert len(location_calls) == 1
+        by_title = {alert.title: alert for alert in alerts}
+        assert by_title["大雨警報"].title_translated == "大雨警報:fr"
+        assert by_title["洪水警報"].title_translated == service._get_warning_name("04", "en")
+
+
+class TestCodesOutsideTable:
+    """import 時の索引（`_CODE_TABLE`）に無い警報コードでも警報を落とさない"""
+
+    @pytest.fixture
+    def extra_code(self, monkeypatch):
+        codes = {
+            **WarningService.WARNING_CODES,
+            "99": {"ja": "テスト警報", "en": "Test Warning", "severity": "high"},
+        }
+        monkeypatch.setattr(WarningService, "WARNING_CODES", codes)
+        return "99"
+
+    def test_静的経路で索引に無いコードも組み立てられる(self, extra_code):
+        service = WarningService()
+        alerts = service._parse_warnings(_payload("130010", warning_code=extra_code), "130000", "en")
+
+        assert len(alerts) == 1
+        assert alerts[0].title == "テスト警報"
+        assert alerts[0].title_translated == "Test Warning"
+
+    async def test_AI経路で索引に無いコードも組み立てられる(self, extra_code):
+        class _FakeTranslator:
+            async def generate_warning_text(self, warning_name_ja, target_lang, area_name=None, severity="medium"):
+                raise RuntimeError("rate limited")
+
+            async def translate_location(self, location, target_lang):
+                return location
+
+        service = WarningService(translator=_FakeTranslator())
+        payload = _payload("130010", warning_code=extra_code)
+        alerts = await service._parse_warnings_with_ai(payload, "130000", "fr")
+
+        assert len(alerts) == 1
+        assert alerts[0].title == "テスト警報"
+        assert alerts[0].title_translated == "Test Warning"
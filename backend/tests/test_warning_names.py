@@ -16,7 +16,7 @@ from app.services.warning_names import (
     NAME_PATTERN,
     WARNING_NAMES,
 )
-from app.services.warning_service import WarningService
+from app.services.warning_service import STATIC_LANGUAGES, _CODE_TABLE, WarningService
 
 EXPECTED_LANGS = {
     "ja", "en", "zh", "zh-TW", "ko", "vi", "th", "id",
@@ -225,3 +225,27 @@ class TestServiceIntegration:
         service = WarningService()
         alerts = service._parse_warnings(self._payload("03"), "130000", "ja")
         assert alerts[0].title == "大雨警報"
+
+
+class TestCodeTable:
+    """`_CODE_TABLE`（警報コード×言語の平坦な索引）が `_get_warning_name` と一致すること。"""
+
+    @pytest.mark.parametrize("lang", sorted(STATIC_LANGUAGES))
+    def test_警報名と重要度が従来の解決と一致する(self, lang):
+        service = WarningService()
+        for code, info in WARNING_NAMES.items():
+            name, severity, alert_type = _CODE_TABLE[(code, lang)]
+            assert name == service._get_warning_name(code, lang)
+            assert severity == info["severity"]
+            assert alert_type == service._get_alert_type(info["severity"])
+
+    def test_説明文がテンプレートどおりに組み立てられる(self):
+        service = WarningService()
+        for lang, tmpl in DESCRIPTION_TEMPLATES.items():
+            assert service._get_description("東京", "大雨警報", lang) == tmpl.format(
+                area="東京", warning="大雨警報"
+            )
+        # 未知の言語は英語テンプレート
+        assert service._get_description("Tokyo", "Heavy Rain Warning", "xx") == (
+            DESCRIPTION_TEMPLATES["en"].format(area="Tokyo", warning="Heavy Rain Warning")
+        )